@@ -0,0 +1,102 @@
+"""Benchmark PDF._to_pdf_safe on a synthetic 100k-line diff corpus.
+
+Compares the current implementation against the previous one, which rebuilt
+its replacement dict and looped ``str.replace`` on every call.
+
+    python benchmarks/bench_to_pdf_safe.py
+"""
+
+import random
+import timeit
+
+from gh_summary import PDF
+from gh_summary.pdf import _latin1_safe
+
+
+def previous_to_pdf_safe(text: str) -> str:
+    if not text:
+        return ""
+
+    repl = {
+        "…": "...",
+        "—": "--",
+        "–": "-",
+        "―": "-",
+        "·": "*",
+        "•": "*",
+        "✓": "v",
+        "✔": "v",
+        "✗": "x",
+        "×": "x",
+        "→": "->",
+        "←": "<-",
+        "↔": "<->",
+        "⇒": "=>",
+        "⇐": "<=",
+        "⇔": "<=>",
+        "⟶": "->",
+        "’": "'",
+        "‘": "'",
+        "“": '"',
+        "”": '"',
+        "′": "'",
+        "″": '"',
+        "\u00a0": " ",  # NBSP
+        "\t": "    ",
+    }
+
+    try:
+        text.encode("latin-1")
+        return text
+    except Exception:
+        pass
+    out = text
+    for k, v in repl.items():
+        if k in out:
+            out = out.replace(k, v)
+    return out.encode("latin-1", "replace").decode("latin-1")
+
+
+def make_corpus(n_lines: int = 100_000, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    ascii_lines = [
+        "    return self._render(item, index)",
+        "}",
+        "",
+        "import os",
+        "        if not text:",
+        "#include <stdio.h>",
+    ]
+    unicode_bits = ["→", "—", "“quoted”", "…", "✓ done", "naïve café", "日本語", "\t"]
+    corpus = []
+    for _ in range(n_lines):
+        r = rng.random()
+        if r < 0.85:
+            corpus.append(rng.choice(ascii_lines) + " " * rng.randint(0, 4))
+        elif r < 0.95:
+            # Repeated non-ASCII lines (comments, docs) benefit from memoization
+            corpus.append("# step " + rng.choice(unicode_bits) + " next")
+        else:
+            corpus.append(f"x = {rng.random()} " + "".join(rng.sample(unicode_bits, 3)))
+    return corpus
+
+
+def main() -> None:
+    corpus = make_corpus()
+    pdf = PDF()
+    assert [pdf._to_pdf_safe(line) for line in corpus] == [previous_to_pdf_safe(line) for line in corpus]
+
+    previous = min(timeit.repeat(lambda: [previous_to_pdf_safe(line) for line in corpus], number=1, repeat=5))
+    # Every round starts with a cold cache, as a fresh report would
+    current = min(
+        timeit.repeat(
+            lambda: [pdf._to_pdf_safe(line) for line in corpus], setup=_latin1_safe.cache_clear, number=1, repeat=5
+        )
+    )
+    print(f"lines:    {len(corpus)}")
+    print(f"previous: {previous * 1000:.1f} ms")
+    print(f"current:  {current * 1000:.1f} ms ({previous / current:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
+from .github import GitHubClient
 from .commit import Commit
 from .pr import PullRequest
 from .pdf import PDF
+from .text_report import HTMLReport, MarkdownReport
 
-__all__ = ["Commit", "PullRequest", "PDF"]
+__all__ = ["Commit", "PullRequest", "PDF", "HTMLReport", "MarkdownReport", "GitHubClient"]
@@ -1,18 +1,53 @@
 import argparse
+import itertools
 import os
 import subprocess
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
 
-from . import Commit, PullRequest, PDF
+import requests
+
+from . import Commit, PullRequest, PDF, HTMLReport, MarkdownReport
+from .cache import DiffCache, ResponseStore
+from .diff import DiffLimits, file_patch_to_diff, normalize_exts, path_allowed, read_diff
+from .github import GitHubClient, iter_pages, repo_allowed
+from .export import NdjsonWriter, write_json
+from .local import iter_local_commits
+from .render import render_chunked, require_pypdf
+from .store import ItemStore
+
+DiffFailure = tuple[Commit | PullRequest, Exception]
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--token", type=str, default="", help="GitHub API token")
-    parser.add_argument("--author", "-a", type=str, required=True, help="Account name to query")
+    parser.add_argument("--author", "-a", type=str, nargs="+", default=None, help="Account name(s) to query")
+    parser.add_argument(
+        "--authors-file",
+        type=str,
+        default=None,
+        help="File with one account name per line to query in addition to --author",
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="With several authors, also write one combined report besides the per-author ones",
+    )
     parser.add_argument("--start-date", "-s", type=str, default=None, help="Start date to query (YYYY-MM-DD)")
     parser.add_argument("--end-date", "-e", type=str, default=None, help="End date to query (YYYY-MM-DD)")
     parser.add_argument("--filename", "-f", type=str, default="summary", help="Output file name")
     parser.add_argument("--filepath", "-p", type=str, default="./", help="Output file path")
+    parser.add_argument(
+        "--format",
+        type=str,
+        nargs="+",
+        choices=["pdf", "html", "md", "json", "ndjson"],
+        default=["pdf"],
+        help="Output formats; ndjson writes one record per line as results arrive",
+    )
     parser.add_argument("--include-diff", "-d", action="store_true", help="Fetch and include diff blocks in PDF")
     parser.add_argument(
         "--max-diff-lines",
@@ -20,6 +55,18 @@ def parse_args() -> argparse.Namespace:
         default=200,
         help="Maximum diff lines to render per item",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help="Render the PDF in chunks of this many items and concatenate them to bound memory (requires pypdf)",
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=1,
+        help="Render PDF chunks in this many processes and concatenate them (requires pypdf)",
+    )
     parser.add_argument(
         "--diff-extensions",
         "-D",
@@ -28,6 +75,57 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="File extensions to include in diffs (e.g. .py .c .cpp .md). Defaults to .py .c .cpp .md if omitted",
     )
+    parser.add_argument(
+        "--max-diff-bytes",
+        type=int,
+        default=20 * 1024 * 1024,
+        help="Stop downloading a diff after this many bytes",
+    )
+    parser.add_argument(
+        "--diff-source",
+        type=str,
+        choices=["unified", "files"],
+        default="unified",
+        help="Fetch full unified diffs, or list changed files first and keep only patches of matching files",
+    )
+    parser.add_argument(
+        "--diff-concurrency",
+        type=int,
+        default=8,
+        help="Number of diffs to download concurrently",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for cached diffs and search responses (default: $XDG_CACHE_HOME/gh-summary)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the local cache")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep fetched commits/PRs in a local store and only search days newer than the previous run",
+    )
+    parser.add_argument(
+        "--local-repo",
+        type=str,
+        action="append",
+        default=None,
+        help="Read commits (and diffs) from this local git clone instead of the search API; may be repeated",
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=["rest", "graphql"],
+        default="rest",
+        help="API used to search pull requests; graphql also fetches diff stats and changed files",
+    )
+    parser.add_argument(
+        "--max-results",
+        type=int,
+        default=None,
+        help="Stop searching once this many commits/PRs have been collected (default: all)",
+    )
 
     repo = parser.add_mutually_exclusive_group()
     repo.add_argument("--include-repo", "-i", type=str, nargs="*", default=None, help="Repository name to include")
@@ -52,128 +150,500 @@ def get_gh_auth_token() -> str:
         raise RuntimeError(f"Error occurred while getting gh auth token.\nstderr: {e.strerr.strip()}")
 
 
-def get_date_range(*, start_date: str = None, end_date: str = None) -> str | None:
-    if not start_date and not end_date:
-        return None
-
-    if start_date and not end_date:
-        return f">={start_date}"
-
-    if not start_date and end_date:
-        return f"<={end_date}"
-
-    return f"{start_date}..{end_date}"
-
-
-def get_save_path(filepath: str, filename: str) -> str:
+def get_save_path(filepath: str, filename: str, ext: str = "pdf") -> str:
     if not os.path.exists(filepath):
         os.makedirs(filepath, exist_ok=True)
 
-    return os.path.abspath(os.path.join(filepath, f"{filename}.pdf"))
+    return os.path.abspath(os.path.join(filepath, f"{filename}.{ext}"))
+
+
+def read_authors(args: argparse.Namespace) -> list[str]:
+    """Return the authors given by ``--author`` and ``--authors-file``, without duplicates."""
+    authors = list(args.author or [])
+    if args.authors_file:
+        with open(args.authors_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    authors.append(line)
+    return list(dict.fromkeys(authors))
+
+
+def collect_author(
+    args: argparse.Namespace,
+    author: str,
+    *,
+    client: GitHubClient,
+    headers: dict[str, str],
+    store: ItemStore | None = None,
+    diff_key: str | None = None,
+    on_item: Callable[[Commit | PullRequest], None] | None = None,
+) -> tuple[list[Commit], list[PullRequest]]:
+    """Collect one author's commits and merged PRs from the API, local clones and/or the incremental store.
+
+    Stored diffs are only reused when they were fetched with the source and limits ``diff_key`` describes.
+    """
+    # In incremental mode only the days after the stored high-water mark are searched
+    pr_kind = "prs" if args.backend == "rest" else f"prs-{args.backend}"
+    commit_start = pr_start = args.start_date
+    if store:
+        commit_start = store.fetch_start(author, "commits", start_date=args.start_date, end_date=args.end_date)
+        pr_start = store.fetch_start(author, pr_kind, start_date=args.start_date, end_date=args.end_date)
+    commits_covered = store is not None and commit_start is None
+    prs_covered = store is not None and pr_start is None
+
+    # The store keeps complete, unfiltered search results so that its coverage holds for any
+    # --include-repo/--exclude-repo/--max-results; those are applied when reading the items back
+    search_options = {
+        "include_repos": None if store else args.include_repo,
+        "exclude_repos": None if store else args.exclude_repo,
+        "max_results": None if store else args.max_results,
+        "on_item": on_item,
+    }
+    if store and on_item:
+
+        def on_allowed_item(item: Commit | PullRequest) -> None:
+            if repo_allowed(item.repo_name, args.include_repo, args.exclude_repo):
+                on_item(item)
+
+        search_options["on_item"] = on_allowed_item
+
+    def get_commits() -> list[Commit]:
+        if args.local_repo:
+            return Commit.collect(
+                itertools.chain.from_iterable(
+                    iter_local_commits(
+                        path,
+                        author,
+                        start_date=args.start_date,
+                        end_date=args.end_date,
+                        include_diff=args.include_diff,
+                    )
+                    for path in args.local_repo
+                ),
+                include_repos=args.include_repo,
+                exclude_repos=args.exclude_repo,
+                max_results=args.max_results,
+                # With --include-diff, on_item feeds the diff downloads; local commits come with their own diffs
+                on_item=None if args.include_diff else on_item,
+            )
+        if commits_covered:
+            return []
+        return Commit.from_search(
+            author,
+            start_date=commit_start,
+            end_date=args.end_date,
+            headers=headers,
+            client=client,
+            **search_options,
+        )
 
+    def get_prs() -> list[PullRequest]:
+        if prs_covered:
+            return []
+        if args.backend == "graphql":
+            return PullRequest.from_graphql_search(
+                author,
+                start_date=pr_start,
+                end_date=args.end_date,
+                client=client,
+                **search_options,
+            )
+        return PullRequest.from_search(
+            author,
+            start_date=pr_start,
+            end_date=args.end_date,
+            headers=headers,
+            client=client,
+            **search_options,
+        )
 
-def main() -> None:
-    args = parse_args()
-    token = args.token or get_gh_auth_token()
-    date_range = get_date_range(start_date=args.start_date, end_date=args.end_date)
+    # The two searches are independent, so they run side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        commits_future = pool.submit(get_commits)
+        prs_future = pool.submit(get_prs)
+        commits, prs = commits_future.result(), prs_future.result()
+
+    if store:
+        # Save this author's items right away, together with the range they cover
+        if not args.local_repo:
+            store.record_commits(author, commits, start_date=args.start_date, end_date=args.end_date, complete=True)
+        store.record_prs(
+            author, prs, start_date=args.start_date, end_date=args.end_date, complete=True, kind=pr_kind
+        )
+        # Stored copies come first so diffs fetched by earlier runs are kept
+        if not args.local_repo:
+            commits = Commit.collect(
+                itertools.chain(
+                    store.commits(author, start_date=args.start_date, end_date=args.end_date, diff_key=diff_key),
+                    commits,
+                ),
+                include_repos=args.include_repo,
+                exclude_repos=args.exclude_repo,
+                max_results=args.max_results,
+            )
+        prs = PullRequest.collect(
+            itertools.chain(
+                store.prs(author, start_date=args.start_date, end_date=args.end_date, diff_key=diff_key), prs
+            ),
+            include_repos=args.include_repo,
+            exclude_repos=args.exclude_repo,
+            max_results=args.max_results,
+        )
 
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "X-Github-Api-Version": "2022-11-28",
+    return commits, prs
+
+
+def collect_authors_batched(
+    args: argparse.Namespace,
+    authors: list[str],
+    *,
+    client: GitHubClient,
+    headers: dict[str, str],
+    on_items: dict[str, Callable[[Commit | PullRequest], None]] | None = None,
+) -> dict[str, tuple[list[Commit], list[PullRequest]]]:
+    """Collect several authors through combined search queries, a handful of authors per request."""
+    search_options = {
+        "start_date": args.start_date,
+        "end_date": args.end_date,
+        "client": client,
+        "include_repos": args.include_repo,
+        "exclude_repos": args.exclude_repo,
+        "max_results": args.max_results,
     }
 
-    QUERY_COMMIT_URL = f"https://api.github.com/search/commits?q=author:{args.author}"
-    if date_range:
-        QUERY_COMMIT_URL += f"+author-date:{date_range}"
-
-    commits = Commit.from_url(
-        QUERY_COMMIT_URL, headers=headers, include_repos=args.include_repo, exclude_repos=args.exclude_repo
-    )
+    def get_prs() -> dict[str, list[PullRequest]]:
+        if args.backend == "graphql":
+            # GraphQL search has its own, much larger budget, so it stays one query per author
+            return {
+                author: PullRequest.from_graphql_search(author, on_item=(on_items or {}).get(author), **search_options)
+                for author in authors
+            }
+        return PullRequest.from_search_many(authors, headers=headers, on_items=on_items, **search_options)
+
+    # The commit and PR searches are independent, so they run side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        commits_future = pool.submit(
+            Commit.from_search_many, authors, headers=headers, on_items=on_items, **search_options
+        )
+        prs_future = pool.submit(get_prs)
+        commits, prs = commits_future.result(), prs_future.result()
+    return {author: (commits[author], prs[author]) for author in authors}
+
+
+def share_items(
+    results: dict[str, tuple[list[Commit], list[PullRequest]]],
+) -> tuple[list[Commit], list[PullRequest]]:
+    """Make every author that found the same commit or PR point at one shared object.
+
+    Commits are matched by SHA alone, so a commit found both in a fork and in
+    its upstream repository is kept once (the copy found first) and has its
+    diff fetched once. Returns the unique commits and PRs.
+    """
+    commits: dict[str, Commit] = {}
+    prs: dict[str, PullRequest] = {}
+    for author, (author_commits, author_prs) in results.items():
+        shared = {c.sha: commits.setdefault(c.sha, c) for c in author_commits}
+        author_prs = [prs.setdefault(pr.html_url, pr) for pr in author_prs]
+        results[author] = (list(shared.values()), author_prs)
+    return list(commits.values()), list(prs.values())
+
+
+def write_reports(
+    args: argparse.Namespace,
+    filename: str,
+    commits: list[Commit],
+    prs: list[PullRequest],
+    *,
+    pdf_options: dict[str, Any],
+    ndjson: NdjsonWriter | None = None,
+    streamed: bool = False,
+) -> list[str]:
+    """Write ``filename`` in every requested format and return the paths written."""
+    outputs: list[str] = []
+    if "ndjson" in args.format:
+        ndjson = ndjson or NdjsonWriter(get_save_path(args.filepath, filename, "ndjson"))
+        if not streamed:
+            for item in [*prs, *commits]:
+                ndjson.write(item)
+        ndjson.close()
+        outputs.append(ndjson.path)
+
+    if "json" in args.format:
+        json_path = get_save_path(args.filepath, filename, "json")
+        write_json(json_path, prs, commits)
+        outputs.append(json_path)
+
+    for fmt, report_cls in (("html", HTMLReport), ("md", MarkdownReport)):
+        if fmt in args.format:
+            report_path = get_save_path(args.filepath, filename, fmt)
+            report = report_cls(**pdf_options)
+            report.add_prs(prs)
+            report.add_commits(commits)
+            report.output(report_path)
+            outputs.append(report_path)
+
+    if "pdf" in args.format:
+        save_path = get_save_path(args.filepath, filename)
+        if args.chunk_size > 0 or args.render_workers > 1:
+            render_chunked(
+                save_path,
+                prs,
+                commits,
+                pdf_options=pdf_options,
+                chunk_size=args.chunk_size,
+                workers=args.render_workers,
+            )
+        else:
+            pdf = PDF(**pdf_options)
+            pdf.add_prs(prs)
+            pdf.add_commits(commits)
+            pdf.output(save_path)
+        outputs.append(save_path)
+    return outputs
 
-    QUERY_PR_URL = f"https://api.github.com/search/issues?q=type:pr+is:merged+author:{args.author}"
-    if date_range:
-        QUERY_PR_URL += f"+merged:{date_range}"
 
-    prs = PullRequest.from_url(
-        QUERY_PR_URL, headers=headers, include_repos=args.include_repo, exclude_repos=args.exclude_repo
-    )
+def main() -> None:
+    args = parse_args()
+    authors = read_authors(args)
+    if not authors:
+        raise SystemExit("No author given. Use --author and/or --authors-file")
+    if "pdf" in args.format and (args.chunk_size > 0 or args.render_workers > 1):
+        # Chunked rendering needs pypdf; find out before spending the searches
+        require_pypdf()
+    token = args.token or get_gh_auth_token()
 
-    save_path = get_save_path(args.filepath, args.filename)
+    # One client (connection pool and rate limiter), cache and store are shared by all authors
+    headers = {"Accept": "application/vnd.github+json"}
+    response_store = None if args.no_cache else ResponseStore(args.cache_dir)
+    # Room for the diff downloads plus both searches, which run at the same time
+    client = GitHubClient(token, pool_size=args.diff_concurrency + 8, response_store=response_store)
+    store = ItemStore(args.cache_dir) if args.incremental else None
 
-    # Optionally fetch diffs
-    if args.include_diff:
-        fetch_diffs_for_commits(commits, token)
-        fetch_diffs_for_prs(prs, token)
+    # A single author keeps the plain file name; with several, each report is suffixed with its author
+    filenames = {a: args.filename if len(authors) == 1 else f"{args.filename}-{a}" for a in authors}
 
     # Normalize diff extensions: ensure they start with '.' and are lowercase
-    diff_exts = None
-    if args.diff_extensions:
-        tmp: list[str] = []
-        for item in args.diff_extensions:
-            # Allow comma-separated input as a convenience
-            parts = [p.strip() for p in item.split(",") if p.strip()]
-            for p in parts:
-                if not p.startswith('.'):
-                    p = '.' + p
-                tmp.append(p.lower())
-        diff_exts = tmp or None
-
-    pdf = PDF(include_diffs=args.include_diff, max_diff_lines=args.max_diff_lines, allowed_diff_exts=diff_exts)
-    pdf.add_prs(prs)
-    pdf.add_commits(commits)
-    pdf.output(save_path)
-
-    print(f"PDF generated successfully: {save_path}")
-
-
-def _auth_headers_for_diff(token: str) -> dict[str, str]:
-    # Use diff-specific Accept; GitHub honors auth to avoid rate limits/private repos
-    return {
-        "Accept": "application/vnd.github.v3.diff",
-        "Authorization": f"Bearer {token}",
-        "X-Github-Api-Version": "2022-11-28",
-    }
+    diff_exts = normalize_exts(args.diff_extensions)
 
-
-def fetch_diffs_for_commits(commits: list[Commit], token: str) -> None:
-    import requests
-
-    headers = _auth_headers_for_diff(token)
-    for c in commits:
-        try:
-            # Use the API endpoint so Authorization works for private repos
-            url = c.api_diff_url
-            res = requests.get(url, headers=headers, timeout=30)
-            if res.ok and res.text:
-                c.diff = res.text
-            elif not res.ok:
-                # Fallback to .diff on HTML URL (may work for public repos)
-                fallback = c.diff_url
-                res2 = requests.get(fallback, headers=headers, timeout=30)
-                if res2.ok and res2.text:
-                    c.diff = res2.text
-        except Exception:
-            # Non-fatal; skip diff on error
-            continue
-
-
-def fetch_diffs_for_prs(prs: list[PullRequest], token: str) -> None:
-    import requests
-
-    headers = _auth_headers_for_diff(token)
-    for pr in prs:
-        try:
-            # Use the API endpoint so Authorization works for private repos
-            url = pr.api_url
-            res = requests.get(url, headers=headers, timeout=30)
-            if res.ok and res.text:
-                pr.diff = res.text
-            elif not res.ok:
-                # Fallback to .diff on HTML URL in case repo is public
-                res2 = requests.get(pr.diff_url, headers=headers, timeout=30)
-                if res2.ok and res2.text:
-                    pr.diff = res2.text
-        except Exception:
-            # Non-fatal; skip diff on error
-            continue
+    # Diffs are downloaded in the background as soon as the search finds their commit or PR
+    pipeline = None
+    ndjson_writers: dict[str, NdjsonWriter] = {}
+    try:
+        if args.include_diff:
+            pipeline = DiffPipeline(
+                client,
+                concurrency=args.diff_concurrency,
+                cache=None if args.no_cache else DiffCache(args.cache_dir),
+                limits=DiffLimits(
+                    allowed_exts=diff_exts, max_lines=args.max_diff_lines, max_bytes=args.max_diff_bytes
+                ),
+                source=args.diff_source,
+            )
+
+        # Without diffs a record is complete as soon as it is found, so NDJSON can be written during the search
+        streamed = "ndjson" in args.format and not args.include_diff and not args.incremental
+        if streamed:
+            for author in authors:
+                ndjson_writers[author] = NdjsonWriter(get_save_path(args.filepath, filenames[author], "ndjson"))
+        on_items = {author: writer.write for author, writer in ndjson_writers.items()}
+        if pipeline:
+            on_items = {author: pipeline.submit for author in authors}
+
+        # Several authors share combined search queries, unless each one needs its own date range or source
+        if len(authors) > 1 and not args.local_repo and not args.incremental:
+            results = collect_authors_batched(args, authors, client=client, headers=headers, on_items=on_items)
+        else:
+            results = {
+                author: collect_author(
+                    args,
+                    author,
+                    client=client,
+                    headers=headers,
+                    store=store,
+                    diff_key=pipeline.key if pipeline else None,
+                    on_item=on_items.get(author),
+                )
+                for author in authors
+            }
+        commits, prs = share_items(results)
+
+        # Wait for the diffs, including those of items that came from the incremental store
+        if pipeline:
+            # Commits from local clones already carry their diffs from git
+            failures = pipeline.finish(prs if args.local_repo else [*commits, *prs])
+            for item, e in failures:
+                print(f"Warning: failed to fetch diff for {item.html_url}: {e}", file=sys.stderr)
+
+        if store and pipeline:
+            # Store the diffs too, so the next run with the same limits does not download them again
+            for author, (author_commits, author_prs) in results.items():
+                if not args.local_repo:
+                    store.put_diffs(author, author_commits, pipeline.key)
+                store.put_diffs(author, author_prs, pipeline.key)
+
+        pdf_options = {
+            "include_diffs": args.include_diff,
+            "max_diff_lines": args.max_diff_lines,
+            "allowed_diff_exts": diff_exts,
+        }
+        outputs: list[str] = []
+        for author, (author_commits, author_prs) in results.items():
+            outputs += write_reports(
+                args,
+                filenames[author],
+                author_commits,
+                author_prs,
+                pdf_options=pdf_options,
+                ndjson=ndjson_writers.get(author),
+                streamed=streamed,
+            )
+        if args.combined and len(authors) > 1:
+            outputs += write_reports(
+                args,
+                args.filename,
+                sorted(commits, key=lambda x: x.date),
+                sorted(prs, key=lambda x: x.merged_at),
+                pdf_options=pdf_options,
+            )
+    finally:
+        # Also on errors: queued diff downloads are dropped instead of delaying the exit
+        if pipeline:
+            pipeline.close()
+        for writer in ndjson_writers.values():
+            writer.close()
+        if store:
+            store.close()
+        client.close()
+
+    for path in outputs:
+        print(f"Report generated successfully: {path}")
+
+
+# Use diff-specific Accept; the client adds Authorization for private repos/rate limits
+DIFF_HEADERS = {"Accept": "application/vnd.github.v3.diff"}
+FILES_HEADERS = {"Accept": "application/vnd.github+json"}
+
+
+def _fetch_diff(client: GitHubClient, url: str, fallback_url: str, limits: DiffLimits) -> str:
+    # Use the API endpoint so Authorization works for private repos
+    with client.get(url, headers=DIFF_HEADERS, stream=True) as res:
+        if res.ok:
+            return read_diff(res.iter_content(chunk_size=64 * 1024), limits)
+        error = requests.HTTPError(f"{res.status_code} {res.reason} for url: {url}", response=res)
+    # Fallback to .diff on HTML URL (may work for public repos)
+    with client.get(fallback_url, headers=DIFF_HEADERS, stream=True) as res2:
+        if res2.ok:
+            return read_diff(res2.iter_content(chunk_size=64 * 1024), limits)
+    raise error
+
+
+def _fetch_files_diff(client: GitHubClient, url: str, limits: DiffLimits) -> str:
+    """Build a diff from the per-file patches of a commit (``/commits/{sha}``) or PR (``/pulls/{n}/files``).
+
+    Only files matching ``limits.allowed_exts`` are kept, and further pages of
+    the file list are not requested once enough rows have been collected.
+    """
+    sections: list[str] = []
+    rows = 0
+    for page in iter_pages(client, url, headers=FILES_HEADERS):
+        files = page.get("files", []) if isinstance(page, dict) else page
+        for f in files:
+            if not f.get("patch"):
+                # Binary file, or patch too large for the API to inline
+                continue
+            if limits.allowed_exts is not None and not path_allowed(f["filename"], limits.allowed_exts):
+                continue
+            sections.append(file_patch_to_diff(f))
+            rows += f["patch"].count("\n") + 1
+        if limits.max_lines and rows > limits.max_lines:
+            break
+    return read_diff([s.encode("utf-8") for s in sections], limits)
+
+
+class DiffPipeline:
+    """Download diffs on a thread pool while the searches are still running.
+
+    ``submit`` is safe to call from search callbacks on any thread, and each
+    commit or PR is downloaded once however often it is submitted. ``finish``
+    waits for the downloads and stores each diff on the item it belongs to.
+    """
+
+    def __init__(
+        self,
+        client: GitHubClient,
+        *,
+        concurrency: int = 8,
+        cache: DiffCache | None = None,
+        limits: DiffLimits = DiffLimits(),
+        source: str = "unified",
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self.limits = limits
+        self.source = source
+        self._pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        self._futures: dict[tuple[str, ...], Future[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        """Describes how diffs are fetched, used to key cached and stored diffs.
+
+        The files API leaves out patches GitHub does not inline, so its diffs
+        are not interchangeable with unified ones even under the same limits.
+        """
+        return f"{self.source}|{self.limits.key}"
+
+    @staticmethod
+    def _key(item: Commit | PullRequest) -> tuple[str, ...]:
+        if isinstance(item, Commit):
+            # A SHA names the same content in every repository, forks and mirrors included
+            return ("commit", item.sha)
+        return ("pr", item.html_url)
+
+    def submit(self, item: Commit | PullRequest) -> None:
+        if item.diff:
+            # Already populated, e.g. by a local repository or the incremental store
+            return
+        key = self._key(item)
+        with self._lock:
+            if key not in self._futures:
+                self._futures[key] = self._pool.submit(self._fetch, item)
+
+    def _fetch(self, item: Commit | PullRequest) -> str:
+        if isinstance(item, PullRequest):
+            if self.source == "files":
+                return _fetch_files_diff(self.client, f"{item.api_url}/files", self.limits)
+            return _fetch_diff(self.client, item.api_url, item.diff_url, self.limits)
+
+        # Commit diffs are immutable, so anything already cached skips the network entirely
+        cached = self.cache.get(item.sha, self.key) if self.cache else None
+        if cached is not None:
+            return cached
+        if self.source == "files":
+            diff = _fetch_files_diff(self.client, item.api_diff_url, self.limits)
+        else:
+            diff = _fetch_diff(self.client, item.api_diff_url, item.diff_url, self.limits)
+        if self.cache and diff:
+            self.cache.put(item.sha, diff, self.key)
+        return diff
+
+    def finish(self, items: list[Commit] | list[PullRequest] | list[Commit | PullRequest]) -> list[DiffFailure]:
+        """Fetch whatever of ``items`` was not submitted yet, wait, and store the diffs on ``items``."""
+        for item in items:
+            self.submit(item)
+        failures: list[DiffFailure] = []
+        for item in items:
+            if item.diff:
+                continue
+            try:
+                item.diff = self._futures[self._key(item)].result()
+            except Exception as e:
+                failures.append((item, e))
+        self._pool.shutdown()
+        return failures
+
+    def close(self) -> None:
+        """Cancel the downloads that have not started yet and wait for the running ones."""
+        self._pool.shutdown(cancel_futures=True)
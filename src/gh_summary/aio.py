@@ -0,0 +1,228 @@
+import asyncio
+import warnings
+from typing import Any, Callable
+
+from .cache import DiffCache
+from .commit import Commit
+from .diff import DiffLimits, DiffReader
+from .github import (
+    API_VERSION,
+    SEARCH_PER_PAGE,
+    SEARCH_RESULT_CAP,
+    _with_per_page,
+    get_date_range,
+    split_date_window,
+)
+from .pr import PullRequest
+from .ratelimit import RateLimiter, resource_for_url
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+SEARCH_HEADERS = {"Accept": "application/vnd.github+json"}
+DIFF_HEADERS = {"Accept": "application/vnd.github.v3.diff"}
+
+
+class AsyncGitHubClient:
+    """Async counterpart of ``GitHubClient`` built on httpx.
+
+    Requests are multiplexed over a few HTTP/2 connections instead of one
+    connection per request in flight, and scheduled through a ``RateLimiter``
+    without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        token: str = "",
+        *,
+        max_connections: int = 4,
+        http2: bool = True,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        if httpx is None:
+            raise ImportError("The async engine requires httpx. Install it with: pip install 'gh-summary[async]'")
+
+        headers = {"X-Github-Api-Version": API_VERSION}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            headers=headers,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=30,
+            follow_redirects=True,
+        )
+
+    async def request(self, method: str, url: str, *, stream: bool = False, **kwargs: Any) -> "httpx.Response":
+        """Send a request, waiting for the rate limiter and retrying rate-limit errors.
+
+        With ``stream=True`` the body is not read; the caller must ``aclose()`` the response.
+        """
+        resource = resource_for_url(url)
+        attempt = 0
+        while True:
+            wait = self.rate_limiter.reserve(resource)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            res = await self._client.send(self._client.build_request(method, url, **kwargs), stream=stream)
+            self.rate_limiter.update(resource, res)
+            if res.status_code in (403, 429) and stream:
+                # retry_delay may look at the body of a 403
+                await res.aread()
+            delay = self.rate_limiter.retry_delay(res, attempt)
+            if delay is None:
+                return res
+            await res.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+
+async def search_items(
+    client: AsyncGitHubClient,
+    url_for_range: Callable[[str | None], str],
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> list[dict[str, Any]]:
+    """Return every item of a date-bounded search, like ``iter_search_windows``.
+
+    Windows over the 1000-result cap are bisected and searched concurrently.
+    ``total_count`` on the first page tells how many pages follow, so they are
+    requested together instead of one ``next`` link at a time.
+    """
+    url = _with_per_page(url_for_range(get_date_range(start_date=start_date, end_date=end_date)))
+    res = await client.get(url, headers=SEARCH_HEADERS)
+    res.raise_for_status()
+    first = res.json()
+    total = first.get("total_count", 0)
+
+    if total > SEARCH_RESULT_CAP:
+        windows = split_date_window(start_date, end_date)
+        if windows:
+            parts = await asyncio.gather(
+                *(search_items(client, url_for_range, start_date=s, end_date=e) for s, e in windows)
+            )
+            return [item for part in parts for item in part]
+        warnings.warn(
+            f"Search for {start_date}..{end_date} has {total} results; only the first {SEARCH_RESULT_CAP} are available"
+        )
+
+    async def page(number: int) -> list[dict[str, Any]]:
+        res = await client.get(f"{url}&page={number}", headers=SEARCH_HEADERS)
+        res.raise_for_status()
+        return res.json().get("items", [])
+
+    pages = -(-min(total, SEARCH_RESULT_CAP) // SEARCH_PER_PAGE)
+    rest = await asyncio.gather(*(page(n) for n in range(2, pages + 1)))
+    return first.get("items", []) + [item for items in rest for item in items]
+
+
+async def fetch_diff(client: AsyncGitHubClient, url: str, fallback_url: str, limits: DiffLimits) -> str:
+    """Stream a diff like ``_fetch_diff``, closing the stream as soon as ``limits`` are reached."""
+    error: Exception | None = None
+    for candidate in (url, fallback_url):
+        res = await client.get(candidate, headers=DIFF_HEADERS, stream=True)
+        try:
+            if res.is_success:
+                reader = DiffReader(limits)
+                async for chunk in res.aiter_bytes(64 * 1024):
+                    if not reader.feed(chunk):
+                        break
+                return reader.text()
+            error = error or httpx.HTTPStatusError(
+                f"{res.status_code} {res.reason_phrase} for url: {candidate}", request=res.request, response=res
+            )
+        finally:
+            await res.aclose()
+    raise error
+
+
+async def collect(
+    author: str,
+    *,
+    token: str = "",
+    start_date: str | None = None,
+    end_date: str | None = None,
+    include_repos: tuple[str, ...] | None = None,
+    exclude_repos: tuple[str, ...] | None = None,
+    max_results: int | None = None,
+    include_diffs: bool = False,
+    limits: DiffLimits = DiffLimits(),
+    diff_concurrency: int = 16,
+    cache: DiffCache | None = None,
+    client: AsyncGitHubClient | None = None,
+) -> tuple[list[Commit], list[PullRequest]]:
+    """Collect ``author``'s commits and merged PRs (and optionally their diffs) asynchronously.
+
+    The commit and PR searches run concurrently, and each starts downloading
+    its diffs as soon as its own search is done. A diff that fails to download
+    is left empty, with a warning. Pass ``client`` to share one connection
+    pool between calls; otherwise one is opened and closed here.
+    """
+    own_client = client is None
+    client = client or AsyncGitHubClient(token)
+    semaphore = asyncio.Semaphore(max(1, diff_concurrency))
+    # Same cache key as DiffPipeline.key; this engine always reads unified diffs
+    cache_key = f"unified|{limits.key}"
+
+    async def diff_for(item: Commit | PullRequest, url: str, fallback_url: str) -> None:
+        async with semaphore:
+            try:
+                item.diff = await fetch_diff(client, url, fallback_url, limits)
+            except Exception as e:
+                warnings.warn(f"failed to fetch diff for {item.html_url}: {e}")
+
+    async def commits() -> list[Commit]:
+        items = await search_items(
+            client, lambda r: Commit.search_url(author, r), start_date=start_date, end_date=end_date
+        )
+        found = Commit.from_items(
+            items, include_repos=include_repos, exclude_repos=exclude_repos, max_results=max_results
+        )
+        if include_diffs:
+            pending = []
+            for c in found:
+                cached = cache.get(c.sha, cache_key) if cache else None
+                if cached is not None:
+                    c.diff = cached
+                else:
+                    pending.append(c)
+            await asyncio.gather(*(diff_for(c, c.api_diff_url, c.diff_url) for c in pending))
+            if cache:
+                for c in pending:
+                    if c.diff:
+                        cache.put(c.sha, c.diff, cache_key)
+        return found
+
+    async def prs() -> list[PullRequest]:
+        items = await search_items(
+            client, lambda r: PullRequest.search_url(author, r), start_date=start_date, end_date=end_date
+        )
+        found = PullRequest.from_items(
+            items, include_repos=include_repos, exclude_repos=exclude_repos, max_results=max_results
+        )
+        if include_diffs:
+            await asyncio.gather(*(diff_for(pr, pr.api_url, pr.diff_url) for pr in found))
+        return found
+
+    try:
+        found_commits, found_prs = await asyncio.gather(commits(), prs())
+        return found_commits, found_prs
+    finally:
+        if own_client:
+            await client.aclose()
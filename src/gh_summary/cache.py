@@ -0,0 +1,153 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gh-summary")
+
+
+class _BoundedDir:
+    """Directory of gzip-compressed files, evicting the least recently used past ``max_bytes``.
+
+    Reads touch an entry's mtime, so the mtime doubles as its last use.
+    """
+
+    suffix = ".gz"
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    def _read(self, path: str) -> bytes | None:
+        try:
+            with gzip.open(path, "rb") as f:
+                data = f.read()
+        except (OSError, EOFError):
+            return None
+        # Touch the entry so eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(data))
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += os.path.getsize(path) - old_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                if not name.endswith(self.suffix):
+                    continue
+                full = os.path.join(root, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        # Drop least recently used entries until we are comfortably under the limit
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries())
+        size = sum(s for _, s, _ in entries)
+        for _, entry_size, full in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(full)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+class DiffCache(_BoundedDir):
+    """Size-bounded on-disk cache of gzip-compressed commit diffs.
+
+    A commit diff never changes for a given SHA, so entries are keyed by the
+    SHA alone (shared by forks and mirrors) and never invalidated; the least
+    recently used entries are evicted once the cache grows past ``max_bytes``.
+    """
+
+    suffix = ".diff.gz"
+
+    def __init__(self, path: str | None = None, *, max_bytes: int = 512 * 1024 * 1024) -> None:
+        super().__init__(os.path.join(path or default_cache_dir(), "diffs"), max_bytes)
+
+    def _entry_path(self, sha: str, variant: str) -> str:
+        key = hashlib.sha256(f"{sha.lower()}#{variant}".encode()).hexdigest()
+        return os.path.join(self.path, key[:2], f"{key}.diff.gz")
+
+    def get(self, sha: str, variant: str = "") -> str | None:
+        """Return the cached diff, or ``None``; ``variant`` tells apart trimmed copies of one diff."""
+        data = self._read(self._entry_path(sha, variant))
+        if data is None:
+            return None
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    def put(self, sha: str, diff: str, variant: str = "") -> None:
+        self._write(self._entry_path(sha, variant), diff.encode("utf-8"))
+
+
+class ResponseStore(_BoundedDir):
+    """On-disk store of GET responses with their validators (ETag / Last-Modified).
+
+    Lets the client revalidate a URL with a conditional request and serve the
+    stored body when GitHub answers ``304 Not Modified``. Like ``DiffCache``,
+    the least recently used responses are evicted past ``max_bytes``.
+    """
+
+    suffix = ".json.gz"
+
+    def __init__(self, path: str | None = None, *, max_bytes: int = 128 * 1024 * 1024) -> None:
+        super().__init__(os.path.join(path or default_cache_dir(), "responses"), max_bytes)
+
+    def _entry_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.path, digest[:2], f"{digest}.json.gz")
+
+    def get(self, key: str) -> dict | None:
+        data = self._read(self._entry_path(key))
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def put(self, key: str, entry: dict) -> None:
+        self._write(self._entry_path(key), json.dumps(entry).encode("utf-8"))
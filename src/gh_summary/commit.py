@@ -1,8 +1,8 @@
-import json
-import requests
-from typing import Any
+from typing import Any, Callable, Iterable
 from pydantic import BaseModel
 
+from .github import Collector, GitHubClient, batch_authors, iter_search_items, iter_search_windows, route_by_login
+
 
 class Commit(BaseModel):
     sha: str
@@ -14,6 +14,7 @@ class Commit(BaseModel):
     date: str
     message: str
     diff: str = ""
+    author_date: str = ""
 
     @property
     def diff_url(self) -> str:
@@ -38,29 +39,152 @@ class Commit(BaseModel):
             author=json_data["commit"]["author"]["name"],
             committer=json_data["commit"]["committer"]["name"],
             date=json_data["commit"]["committer"]["date"],
+            author_date=json_data["commit"]["author"].get("date", ""),
             message=json_data["commit"]["message"],
         )
 
+    @staticmethod
+    def search_url(author: str | list[str], date_range: str | None = None) -> str:
+        authors = [author] if isinstance(author, str) else author
+        url = "https://api.github.com/search/commits?q=" + "+".join(f"author:{a}" for a in authors)
+        if date_range:
+            url += f"+author-date:{date_range}"
+        return url
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[dict[str, Any]],
+        *,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[Commit], None] | None" = None,
+    ) -> "list[Commit]":
+        return cls.collect(
+            (cls.from_json(item) for item in items),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+
+    @classmethod
+    def collect(
+        cls,
+        commits: "Iterable[Commit]",
+        *,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[Commit], None] | None" = None,
+    ) -> "list[Commit]":
+        """De-duplicate and filter commits; ``on_item`` sees each kept one as soon as it arrives."""
+
+        collector = Collector(
+            lambda c: (c.repo_name, c.sha),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+        for commit in commits:
+            collector.add(commit)
+            if collector.full:
+                break
+
+        return sorted(collector.items, key=lambda x: x.date)
+
     @classmethod
     def from_url(
         cls,
         url: str,
         *,
         headers: dict[str, Any] | None = None,
+        client: GitHubClient | None = None,
         include_repos: tuple[str, ...] | None = None,
         exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[Commit], None] | None" = None,
     ) -> "list[Commit]":
-        res = requests.get(url, headers=headers)
-        data = json.loads(res.text)
-
-        def should_include_repo(repo_name: str) -> bool:
-            if include_repos:
-                return repo_name in include_repos
-            if exclude_repos:
-                return repo_name not in exclude_repos
-            return True
-
-        return sorted(
-            [cls.from_json(item) for item in data["items"] if should_include_repo(item["repository"]["full_name"])],
-            key=lambda x: x.date,
+        return cls.from_items(
+            iter_search_items(client or GitHubClient(), url, headers=headers),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
         )
+
+    @classmethod
+    def from_search(
+        cls,
+        author: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        headers: dict[str, Any] | None = None,
+        client: GitHubClient | None = None,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[Commit], None] | None" = None,
+    ) -> "list[Commit]":
+        """Search commits by ``author``, splitting the date range past the 1000-result cap."""
+        items = iter_search_windows(
+            client or GitHubClient(),
+            lambda date_range: cls.search_url(author, date_range),
+            start_date=start_date,
+            end_date=end_date,
+            headers=headers,
+        )
+        return cls.from_items(
+            items,
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+
+    @classmethod
+    def from_search_many(
+        cls,
+        authors: list[str],
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        headers: dict[str, Any] | None = None,
+        client: GitHubClient | None = None,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_items: "dict[str, Callable[[Commit], None]] | None" = None,
+    ) -> "dict[str, list[Commit]]":
+        """Search several authors with a few combined ``author:a author:b ...`` queries.
+
+        Results are split back up by the commit author's login. ``max_results`` applies per author.
+        """
+        client = client or GitHubClient()
+        collectors = {
+            author: Collector(
+                lambda c: (c.repo_name, c.sha),
+                include_repos=include_repos,
+                exclude_repos=exclude_repos,
+                max_results=max_results,
+                on_item=(on_items or {}).get(author),
+            )
+            for author in authors
+        }
+        for batch in batch_authors(authors):
+            items = iter_search_windows(
+                client,
+                lambda date_range, batch=batch: cls.search_url(batch, date_range),
+                start_date=start_date,
+                end_date=end_date,
+                headers=headers,
+            )
+            # Items are handed to their author's collector as pages arrive
+            for author, item in route_by_login(items, batch, lambda item: (item.get("author") or {}).get("login")):
+                collectors[author].add(cls.from_json(item))
+                if all(collectors[a].full for a in batch):
+                    break
+        return {author: sorted(c.items, key=lambda x: x.date) for author, c in collectors.items()}
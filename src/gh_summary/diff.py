@@ -0,0 +1,280 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+DEFAULT_DIFF_EXTS = (".py", ".c", ".cpp", ".md")
+
+
+def normalize_exts(exts: Iterable[str] | None) -> tuple[str, ...]:
+    """Normalize extensions to lowercase with a leading dot; comma-separated items are split."""
+    norm: list[str] = []
+    for item in exts or ():
+        for e in item.split(","):
+            e = e.strip().lower()
+            if not e:
+                continue
+            if not e.startswith("."):
+                e = "." + e
+            norm.append(e)
+    return tuple(norm) or DEFAULT_DIFF_EXTS
+
+
+@dataclass
+class DiffFile:
+    """File header of a unified diff (the ``diff --git a/... b/...`` line)."""
+
+    a_path: str
+    b_path: str
+
+    @property
+    def path(self) -> str:
+        return self.b_path or self.a_path
+
+
+@dataclass
+class Hunk:
+    """A single ``@@`` hunk with its ``(kind, text)`` rows, kind being ``+``, ``-`` or `` ``."""
+
+    header_raw: str
+    old_start: int
+    new_start: int
+    lines: list[tuple[str, str]] = field(default_factory=list)
+
+
+# (kind, old line number, new line number, text); a missing number is ""
+DiffRow = tuple[str, str, str, str]
+
+
+def numbered_rows(hunk: Hunk, limit: int = 0) -> list[DiffRow]:
+    """Number the rows of ``hunk`` like GitHub's diff view, keeping at most ``limit`` rows (0 for all)."""
+    old_ln = hunk.old_start
+    new_ln = hunk.new_start
+    rows: list[DiffRow] = []
+    for kind, text in hunk.lines[:limit] if limit else hunk.lines:
+        if kind == "+":
+            rows.append((kind, "", str(new_ln), text))
+            new_ln += 1
+        elif kind == "-":
+            rows.append((kind, str(old_ln), "", text))
+            old_ln += 1
+        else:  # context
+            rows.append((kind, str(old_ln), str(new_ln), text))
+            old_ln += 1
+            new_ln += 1
+    return rows
+
+
+def path_allowed(path: str, allowed_exts: tuple[str, ...]) -> bool:
+    """Return whether ``path`` ends with one of ``allowed_exts`` (lowercase, with leading dot)."""
+    return bool(path) and path.lower().endswith(allowed_exts)
+
+
+def iter_lines(text: str, *, allowed_exts: tuple[str, ...] | None = None) -> Iterator[str]:
+    """Yield the lines of ``text`` one at a time without splitting it up front.
+
+    With ``allowed_exts``, sections of files with other extensions are jumped
+    over in one search for the next ``diff --git`` header instead of being split.
+    """
+    start = 0
+    end = len(text)
+    while start < end:
+        nl = text.find("\n", start)
+        line_end = end if nl == -1 else nl
+        line = text[start:line_end]
+        if (
+            allowed_exts is not None
+            and line.startswith("diff --git ")
+            and not path_allowed(_parse_file_header(line).path, allowed_exts)
+        ):
+            nxt = text.find("\ndiff --git ", line_end)
+            start = end if nxt == -1 else nxt + 1
+            continue
+        yield line
+        start = line_end + 1
+
+
+def _parse_file_header(line: str) -> DiffFile:
+    parts = line.split()
+    a_path = parts[2][2:] if len(parts) > 2 else ""
+    b_path = parts[3][2:] if len(parts) > 3 else a_path
+    return DiffFile(a_path=a_path, b_path=b_path)
+
+
+def _parse_hunk_header(line: str) -> Hunk:
+    try:
+        # @@ -old_start,old_count +new_start,new_count @@
+        header = line.split("@@")[1].strip()
+        left, right = header.split(" ")[:2]
+        old_start = int(left.split(",")[0].lstrip("-"))
+        new_start = int(right.split(",")[0].lstrip("+"))
+    except Exception:
+        old_start = new_start = 0
+    return Hunk(header_raw=line, old_start=old_start, new_start=new_start)
+
+
+def iter_unified_diff(
+    source: str | Iterable[str], *, allowed_exts: tuple[str, ...] | None = None
+) -> Iterator[DiffFile | Hunk]:
+    """Lazily parse a unified diff into a stream of ``DiffFile`` and ``Hunk`` items.
+
+    ``source`` is the diff text or any iterable of lines (e.g. an open file or a
+    streamed HTTP body). A ``DiffFile`` is yielded as soon as its header is read
+    and each ``Hunk`` once it is complete, so memory is bounded by one hunk.
+
+    With ``allowed_exts``, files whose path does not match are dropped at their
+    ``diff --git`` header: their lines are skipped without being parsed.
+    """
+    lines = iter_lines(source, allowed_exts=allowed_exts) if isinstance(source, str) else source
+    in_file = False
+    hunk: Hunk | None = None
+    for ln in lines:
+        if ln.startswith("diff --git "):
+            if hunk is not None:
+                yield hunk
+                hunk = None
+            diff_file = _parse_file_header(ln.rstrip("\r\n"))
+            in_file = allowed_exts is None or path_allowed(diff_file.path, allowed_exts)
+            if in_file:
+                yield diff_file
+        elif not in_file:
+            continue
+        elif ln.startswith("@@ "):
+            if hunk is not None:
+                yield hunk
+            hunk = _parse_hunk_header(ln.rstrip("\r\n"))
+        elif hunk is not None and ln.startswith(("+", "-", " ")):
+            ln = ln.rstrip("\r\n")
+            hunk.lines.append((ln[0], ln[1:]))
+        # anything else (index / --- / +++ lines, "No newline at end of file" markers) is ignored
+
+    if hunk is not None:
+        yield hunk
+
+
+def file_patch_to_diff(file: dict) -> str:
+    """Turn one entry of a commit/PR ``files`` API response into a unified diff section."""
+    b_path = file["filename"]
+    a_path = file.get("previous_filename") or b_path
+    return f"diff --git a/{a_path} b/{b_path}\n--- a/{a_path}\n+++ b/{b_path}\n{file.get('patch', '')}\n"
+
+
+@dataclass(frozen=True)
+class DiffLimits:
+    """What part of a diff is worth downloading: matching files, up to a row and byte budget."""
+
+    allowed_exts: tuple[str, ...] | None = None
+    max_lines: int = 0
+    max_bytes: int | None = None
+
+    @property
+    def key(self) -> str:
+        """Stable description of these limits, used to key cached trimmed diffs."""
+        exts = ",".join(sorted(self.allowed_exts)) if self.allowed_exts is not None else "*"
+        return f"{exts}|{self.max_lines}|{self.max_bytes}"
+
+
+_FILE_HEADER = b"diff --git "
+
+
+class DiffReader:
+    """Incremental form of ``read_diff`` for callers that receive the body chunk by chunk.
+
+    ``feed`` returns ``False`` once the limits are reached and nothing more
+    needs to be read; ``text()`` returns what was kept.
+    """
+
+    def __init__(self, limits: DiffLimits) -> None:
+        self.limits = limits
+        self._out: list[str] = []
+        self._pending = bytearray()
+        # Rest of the current line lies in a skipped file and is dropped as it arrives
+        self._skipping_line = False
+        self._rows = 0
+        self._read = 0
+        self._in_file = False
+        self._in_hunk = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        if self._done:
+            return False
+        if not chunk:
+            return True
+
+        # Bytes count as they arrive, so the budget also holds inside a single huge line
+        max_bytes = self.limits.max_bytes
+        over_budget = max_bytes is not None and self._read + len(chunk) > max_bytes
+        if over_budget:
+            chunk = chunk[: max(0, max_bytes - self._read)]
+        self._read += len(chunk)
+
+        start = 0
+        if self._skipping_line:
+            newline = chunk.find(b"\n")
+            if newline == -1:
+                return self._stop() if over_budget else True
+            self._skipping_line = False
+            start = newline + 1
+
+        # Only the new bytes are searched for newlines; the pending part has none
+        searched = len(self._pending)
+        self._pending += memoryview(chunk)[start:]
+        line_start = 0
+        while (newline := self._pending.find(b"\n", max(line_start, searched))) != -1:
+            if not self._line(bytes(self._pending[line_start:newline])):
+                return self._stop()
+            line_start = newline + 1
+        del self._pending[:line_start]
+
+        # A partial line outside the kept files is not needed, unless it may be the next file header
+        if not self._in_file and len(self._pending) >= len(_FILE_HEADER):
+            if not self._pending.startswith(_FILE_HEADER):
+                self._pending.clear()
+                self._skipping_line = True
+        return self._stop() if over_budget else True
+
+    def _stop(self) -> bool:
+        self._done = True
+        return False
+
+    def text(self) -> str:
+        if not self._done and self._pending:
+            self._line(bytes(self._pending))
+            self._pending.clear()
+        self._done = True
+        return "\n".join(self._out) + "\n" if self._out else ""
+
+    def _line(self, raw: bytes) -> bool:
+        limits = self.limits
+        if raw.startswith(_FILE_HEADER):
+            line = raw.decode("utf-8", "replace").rstrip("\r")
+            self._in_hunk = False
+            self._in_file = limits.allowed_exts is None or path_allowed(
+                _parse_file_header(line).path, limits.allowed_exts
+            )
+        elif not self._in_file:
+            return True
+        elif raw.startswith(b"@@ "):
+            self._in_hunk = True
+        elif self._in_hunk and raw.startswith((b"+", b"-", b" ")):
+            self._rows += 1
+            if limits.max_lines and self._rows > limits.max_lines:
+                return False
+
+        if self._in_file:
+            self._out.append(raw.decode("utf-8", "replace"))
+        return True
+
+
+def read_diff(chunks: Iterable[bytes], limits: DiffLimits) -> str:
+    """Read a streamed diff body, keeping only what ``limits`` allows.
+
+    Files not matching ``allowed_exts`` are dropped, and reading stops as soon
+    as ``max_lines`` hunk rows have been kept or ``max_bytes`` have been read.
+    The caller can then close the connection without downloading the rest of
+    the body.
+    """
+    reader = DiffReader(limits)
+    for chunk in chunks:
+        if not reader.feed(chunk):
+            break
+    return reader.text()
@@ -0,0 +1,49 @@
+import json
+import threading
+from typing import Any, TextIO
+
+from .commit import Commit
+from .pr import PullRequest
+
+
+def to_record(item: Commit | PullRequest) -> dict[str, Any]:
+    """Return ``item`` as a plain dict tagged with its ``type`` (``"pr"`` or ``"commit"``)."""
+    return {"type": "pr" if isinstance(item, PullRequest) else "commit", **item.model_dump()}
+
+
+def write_json(path: str, prs: list[PullRequest], commits: list[Commit]) -> None:
+    data = {
+        "prs": [pr.model_dump() for pr in prs],
+        "commits": [c.model_dump() for c in commits],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class NdjsonWriter:
+    """Write one ``Commit``/``PullRequest`` record per line as soon as it is known.
+
+    Each line is flushed immediately, so a consumer tailing the file sees
+    records while the search is still running. The commit and PR searches
+    may write from different threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: TextIO = open(path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, item: Commit | PullRequest) -> None:
+        line = json.dumps(to_record(item), ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
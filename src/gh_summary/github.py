@@ -0,0 +1,329 @@
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+from .cache import ResponseStore
+from .ratelimit import RateLimiter, resource_for_url
+
+API_VERSION = "2022-11-28"
+
+T = TypeVar("T")
+
+# GitHub search endpoints accept at most 100 results per page
+SEARCH_PER_PAGE = 100
+# ... and never return more than 1000 results for a single query
+SEARCH_RESULT_CAP = 1000
+# Lower bound used when an open-ended date range has to be split. Not GitHub's launch in
+# 2008: imported history keeps older author dates, and bisecting from 1970 costs ~2 requests
+SEARCH_EPOCH = date(1970, 1, 1)
+# Search queries are limited to 256 characters and five AND/OR/NOT operators; repeated
+# ``author:`` qualifiers match any of the authors, and are kept within the same bounds
+SEARCH_QUERY_MAX_LENGTH = 256
+MAX_AUTHORS_PER_QUERY = 6
+
+
+class GitHubClient:
+    """Keep-alive HTTP client shared by every GitHub request in a run.
+
+    All search and diff fetches go through one ``requests.Session`` whose
+    connection pool is sized to the number of concurrent requests, so
+    connections (and their TLS handshakes) are reused instead of reopened.
+    Every request is also scheduled through a ``RateLimiter`` and retried when
+    GitHub answers with a rate-limit error.
+    """
+
+    def __init__(
+        self,
+        token: str = "",
+        *,
+        pool_size: int = 10,
+        response_store: ResponseStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.token = token
+        self.response_store = response_store
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.session = requests.Session()
+        # api.github.com plus github.com for .diff fallbacks
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["X-Github-Api-Version"] = API_VERSION
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def request(
+        self, method: str, url: str, *, headers: dict[str, Any] | None = None, timeout: float = 30, **kwargs: Any
+    ) -> requests.Response:
+        resource = resource_for_url(url)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(resource)
+            res = self.session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+            self.rate_limiter.update(resource, res)
+            delay = self.rate_limiter.retry_delay(res, attempt)
+            if delay is None:
+                return res
+            res.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_conditional(self, url: str, *, headers: dict[str, Any] | None = None) -> requests.Response:
+        """GET ``url``, revalidating a stored copy with If-None-Match / If-Modified-Since.
+
+        A ``304 Not Modified`` answer is turned back into a ``200`` response built
+        from the stored body, so callers cannot tell the difference.
+        """
+        if self.response_store is None:
+            return self.get(url, headers=headers)
+
+        key = f"{self.token}|{(headers or {}).get('Accept', '')}|{url}"
+        stored = self.response_store.get(key)
+        request_headers = dict(headers or {})
+        if stored:
+            if stored.get("etag"):
+                request_headers["If-None-Match"] = stored["etag"]
+            if stored.get("last_modified"):
+                request_headers["If-Modified-Since"] = stored["last_modified"]
+
+        res = self.get(url, headers=request_headers)
+        if res.status_code == 304 and stored:
+            return _stored_response(url, stored)
+
+        if res.ok and (res.headers.get("ETag") or res.headers.get("Last-Modified")):
+            self.response_store.put(
+                key,
+                {
+                    "etag": res.headers.get("ETag"),
+                    "last_modified": res.headers.get("Last-Modified"),
+                    "headers": {k: v for k, v in res.headers.items() if k.lower() in ("content-type", "link")},
+                    "body": res.text,
+                },
+            )
+        return res
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _stored_response(url: str, stored: dict) -> requests.Response:
+    res = requests.Response()
+    res.status_code = 200
+    res.url = url
+    res.headers = CaseInsensitiveDict(stored.get("headers", {}))
+    res.encoding = "utf-8"
+    res._content = stored["body"].encode("utf-8")
+    return res
+
+
+def _with_per_page(url: str, per_page: int = SEARCH_PER_PAGE) -> str:
+    if "per_page=" in url:
+        return url
+    sep = "&" if "?" in url else "?"
+    return f"{url}{sep}per_page={per_page}"
+
+
+def iter_search_items(
+    client: GitHubClient, url: str, *, headers: dict[str, Any] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield items from a GitHub search query, following ``Link: rel="next"`` pages.
+
+    Pages are requested lazily, so a caller that stops iterating early does not
+    pay for the remaining round-trips.
+    """
+    next_url: str | None = _with_per_page(url)
+    while next_url:
+        res = client.get_conditional(next_url, headers=headers)
+        res.raise_for_status()
+        data = res.json()
+        yield from data.get("items", [])
+        next_url = res.links.get("next", {}).get("url")
+
+
+def iter_pages(client: GitHubClient, url: str, *, headers: dict[str, Any] | None = None) -> Iterator[Any]:
+    """Yield the decoded JSON body of each page of a paginated REST endpoint."""
+    next_url: str | None = _with_per_page(url)
+    while next_url:
+        res = client.get(next_url, headers=headers)
+        res.raise_for_status()
+        yield res.json()
+        next_url = res.links.get("next", {}).get("url")
+
+
+def get_date_range(*, start_date: str | None = None, end_date: str | None = None) -> str | None:
+    if not start_date and not end_date:
+        return None
+
+    if start_date and not end_date:
+        return f">={start_date}"
+
+    if not start_date and end_date:
+        return f"<={end_date}"
+
+    return f"{start_date}..{end_date}"
+
+
+def split_date_window(start_date: str | None, end_date: str | None) -> list[tuple[str, str]] | None:
+    """Bisect a (possibly open-ended) date range, or return ``None`` if it is a single day."""
+    start = date.fromisoformat(start_date) if start_date else SEARCH_EPOCH
+    end = date.fromisoformat(end_date) if end_date else date.today()
+    if start >= end:
+        return None
+    mid = start + (end - start) // 2
+    return [(start.isoformat(), mid.isoformat()), ((mid + timedelta(days=1)).isoformat(), end.isoformat())]
+
+
+def iter_search_windows(
+    client: GitHubClient,
+    url_for_range: Callable[[str | None], str],
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    headers: dict[str, Any] | None = None,
+    concurrency: int = 4,
+) -> Iterator[dict[str, Any]]:
+    """Yield every item of a date-bounded search, working around the 1000-result cap.
+
+    ``url_for_range`` builds the search URL for a date-range qualifier (see
+    ``get_date_range``). Whenever a window reports more than 1000 results it is
+    bisected and both halves are searched instead. Windows and their pages are
+    fetched concurrently; items are yielded as pages arrive, so their order is
+    unspecified and callers should sort/dedupe.
+    """
+
+    def fetch(url: str) -> tuple[dict[str, Any], str | None]:
+        res = client.get_conditional(url, headers=headers)
+        res.raise_for_status()
+        return res.json(), res.links.get("next", {}).get("url")
+
+    def submit_window(start: str | None, end: str | None) -> None:
+        url = _with_per_page(url_for_range(get_date_range(start_date=start, end_date=end)))
+        pending[pool.submit(fetch, url)] = (start, end, True)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    pending: dict = {}
+    try:
+        submit_window(start_date, end_date)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, end, first_page = pending.pop(future)
+                data, next_url = future.result()
+                if first_page and data.get("total_count", 0) > SEARCH_RESULT_CAP:
+                    windows = split_date_window(start, end)
+                    if windows:
+                        for sub_start, sub_end in windows:
+                            submit_window(sub_start, sub_end)
+                        continue
+                    warnings.warn(
+                        f"Search for {start}..{end} has {data['total_count']} results; "
+                        f"only the first {SEARCH_RESULT_CAP} are available"
+                    )
+                yield from data.get("items", [])
+                if next_url:
+                    pending[pool.submit(fetch, next_url)] = (start, end, False)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def batch_authors(authors: list[str], *, reserved: int = 64) -> list[list[str]]:
+    """Group ``authors`` so that each group's ``author:`` qualifiers fit into one search query.
+
+    ``reserved`` is the room left for the rest of the query (type and date qualifiers).
+    """
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    length = reserved
+    for author in authors:
+        qualifier = len(f"author:{author}") + 1
+        if batch and (len(batch) >= MAX_AUTHORS_PER_QUERY or length + qualifier > SEARCH_QUERY_MAX_LENGTH):
+            batches.append(batch)
+            batch, length = [], reserved
+        batch.append(author)
+        length += qualifier
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def route_by_login(
+    items: Iterator[dict[str, Any]], authors: list[str], login_of: Callable[[dict[str, Any]], str | None]
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Pair each item of a multi-author search with the author it belongs to (logins compare case-insensitively)."""
+    by_login = {author.lower(): author for author in authors}
+    for item in items:
+        login = login_of(item)
+        author = by_login.get(login.lower()) if login else None
+        if author is None and len(authors) == 1:
+            author = authors[0]
+        if author is not None:
+            yield author, item
+
+
+def repo_allowed(
+    repo_name: str, include_repos: tuple[str, ...] | None = None, exclude_repos: tuple[str, ...] | None = None
+) -> bool:
+    """Apply the ``--include-repo`` / ``--exclude-repo`` filter to ``repo_name``."""
+    if include_repos:
+        return repo_name in include_repos
+    if exclude_repos:
+        return repo_name not in exclude_repos
+    return True
+
+
+class Collector(Generic[T]):
+    """De-duplicate and repo-filter search results as they arrive.
+
+    ``on_item`` sees each kept item immediately, so work on it (NDJSON output,
+    diff downloads) can start while later pages are still being fetched.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[T], Hashable],
+        *,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: Callable[[T], None] | None = None,
+    ) -> None:
+        self.key = key
+        self.include_repos = include_repos
+        self.exclude_repos = exclude_repos
+        self.max_results = max_results
+        self.on_item = on_item
+        self._items: dict[Hashable, T] = {}
+
+    @property
+    def full(self) -> bool:
+        return self.max_results is not None and len(self._items) >= self.max_results
+
+    def add(self, item: T) -> None:
+        key = self.key(item)
+        if self.full or key in self._items or not repo_allowed(item.repo_name, self.include_repos, self.exclude_repos):
+            return
+        self._items[key] = item
+        if self.on_item is not None:
+            self.on_item(item)
+
+    @property
+    def items(self) -> list[T]:
+        return list(self._items.values())
@@ -0,0 +1,71 @@
+from typing import Any, Iterator
+
+from .github import SEARCH_RESULT_CAP, GitHubClient, get_date_range, split_date_window
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# One query returns up to 100 merged PRs together with their stats and changed files
+MERGED_PRS_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number
+        url
+        title
+        body
+        mergedAt
+        additions
+        deletions
+        changedFiles
+        repository { nameWithOwner }
+        files(first: 100) { nodes { path } }
+      }
+    }
+  }
+}
+"""
+
+
+def _search(client: GitHubClient, query: str, cursor: str | None) -> dict[str, Any]:
+    res = client.post(GRAPHQL_URL, json={"query": MERGED_PRS_QUERY, "variables": {"q": query, "cursor": cursor}})
+    res.raise_for_status()
+    data = res.json()
+    if data.get("errors"):
+        raise RuntimeError(f"GraphQL query failed: {data['errors'][0].get('message', data['errors'])}")
+    return data["data"]["search"]
+
+
+def iter_merged_pr_nodes(
+    client: GitHubClient,
+    author: str,
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield GraphQL ``PullRequest`` nodes merged by ``author``, 100 per round-trip.
+
+    Like the REST search, GraphQL search stops at 1000 results, so larger date
+    ranges are bisected until every window fits.
+    """
+    query = f"type:pr is:merged author:{author}"
+    date_range = get_date_range(start_date=start_date, end_date=end_date)
+    if date_range:
+        query += f" merged:{date_range}"
+
+    page = _search(client, query, None)
+    if page["issueCount"] > SEARCH_RESULT_CAP:
+        windows = split_date_window(start_date, end_date)
+        if windows:
+            for sub_start, sub_end in windows:
+                yield from iter_merged_pr_nodes(client, author, start_date=sub_start, end_date=sub_end)
+            return
+
+    while True:
+        # Non-PR nodes come back as empty objects
+        yield from (node for node in page["nodes"] if node)
+        if not page["pageInfo"]["hasNextPage"]:
+            return
+        page = _search(client, query, page["pageInfo"]["endCursor"])
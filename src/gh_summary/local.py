@@ -0,0 +1,106 @@
+import os
+import re
+import subprocess
+from typing import Iterator
+
+from .commit import Commit
+
+# Record / field separators that cannot appear in git's formatted output
+_RS = "\x1e"
+_FS = "\x1f"
+_LOG_FORMAT = _RS + _FS.join(["%H", "%an", "%cn", "%cI", "%aI", "%B"]) + _FS
+
+_GITHUB_REMOTE = re.compile(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$")
+
+
+def _git(path: str, *args: str) -> str:
+    try:
+        result = subprocess.run(["git", "-C", path, *args], capture_output=True, text=True, check=True)
+    except FileNotFoundError:
+        raise FileNotFoundError("git is not installed. Please install git to use --local-repo")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Error occurred while running git in {path}.\nstderr: {e.stderr.strip()}")
+    return result.stdout
+
+
+def repo_identity(path: str) -> tuple[str, str]:
+    """Return ``(repo_name, repo_url)`` for a local clone, preferring its GitHub ``origin``."""
+    try:
+        remote = _git(path, "remote", "get-url", "origin").strip()
+    except RuntimeError:
+        remote = ""
+    match = _GITHUB_REMOTE.search(remote)
+    if match:
+        repo_name = match.group(1)
+        return repo_name, f"https://github.com/{repo_name}"
+    path = os.path.abspath(path)
+    return os.path.basename(path), f"file://{path}"
+
+
+def iter_local_commits(
+    path: str,
+    author: str,
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    include_diff: bool = False,
+) -> Iterator[Commit]:
+    """Yield commits by ``author`` from the git clone at ``path``.
+
+    ``author`` is matched by ``git log --author`` (name or email). Like the
+    GitHub search, the date range applies to the author date. With
+    ``include_diff`` each commit carries its unified diff from ``git log -p``.
+    Output is streamed one commit at a time, so memory stays bounded by the
+    largest single commit.
+    """
+    repo_name, repo_url = repo_identity(path)
+
+    # `git log -p` prints no diff for merge commits, so they are left out
+    cmd = ["git", "-C", path, "log", "--no-color", "--no-merges", f"--author={author}", f"--format={_LOG_FORMAT}"]
+    if start_date:
+        # Committer date is normally not earlier than author date, so this only prunes
+        cmd.append(f"--since={start_date}T00:00:00")
+    if include_diff:
+        cmd += ["-p", "--no-ext-diff"]
+
+    def parse(record: str) -> Commit | None:
+        sha, author_name, committer, committer_date, author_date, message, diff = record.split(_FS, 6)
+        day = author_date[:10]
+        if (start_date and day < start_date) or (end_date and day > end_date):
+            return None
+        return Commit(
+            sha=sha,
+            html_url=f"{repo_url}/commit/{sha}",
+            repo_url=repo_url,
+            repo_name=repo_name,
+            author=author_name,
+            committer=committer,
+            date=committer_date,
+            author_date=author_date,
+            message=message.strip("\n"),
+            diff=diff.lstrip("\n") if include_diff else "",
+        )
+
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, errors="replace")
+    except FileNotFoundError:
+        raise FileNotFoundError("git is not installed. Please install git to use --local-repo")
+
+    with proc:
+        record: list[str] = []
+        for line in proc.stdout:
+            if line.startswith(_RS):
+                if record:
+                    commit = parse("".join(record))
+                    if commit:
+                        yield commit
+                record = [line[1:]]
+            elif record:
+                record.append(line)
+        if record:
+            commit = parse("".join(record))
+            if commit:
+                yield commit
+
+    if proc.returncode:
+        raise RuntimeError(f"git log failed in {path} (exit code {proc.returncode})")
@@ -1,7 +1,59 @@
 import fpdf
 from datetime import datetime
+from functools import lru_cache
 
 from . import Commit, PullRequest
+from .diff import DiffFile, iter_unified_diff, normalize_exts, numbered_rows
+
+
+# Unicode punctuation/symbols mapped to Latin-1 friendly equivalents
+_PDF_SAFE_REPLACEMENTS = {
+    "…": "...",
+    "—": "--",
+    "–": "-",
+    "―": "-",
+    "·": "*",
+    "•": "*",
+    "✓": "v",
+    "✔": "v",
+    "✗": "x",
+    "×": "x",
+    "→": "->",
+    "←": "<-",
+    "↔": "<->",
+    "⇒": "=>",
+    "⇐": "<=",
+    "⇔": "<=>",
+    "⟶": "->",
+    "’": "'",
+    "‘": "'",
+    "“": '"',
+    "”": '"',
+    "′": "'",
+    "″": '"',
+    "\u00a0": " ",  # NBSP
+    "\t": "    ",
+}
+_PDF_SAFE_TABLE = str.maketrans(_PDF_SAFE_REPLACEMENTS)
+
+
+@lru_cache(maxsize=8192)
+def _latin1_safe(text: str) -> str:
+    # Fast path: if it encodes, return as-is
+    try:
+        text.encode("latin-1")
+        return text
+    except UnicodeEncodeError:
+        pass
+
+    # Apply simple replacements, then lossy conversion for anything else
+    return text.translate(_PDF_SAFE_TABLE).encode("latin-1", "replace").decode("latin-1")
+
+
+# Diff row styling: background per row kind, sign color, line number color
+_DIFF_ROW_FILLS = {"+": (230, 255, 237), "-": (255, 238, 240)}
+_DIFF_SIGN_COLORS = {"+": (3, 102, 3), "-": (158, 0, 6)}
+_DIFF_LINENO_COLOR = (110, 119, 129)
 
 
 class PDF(fpdf.FPDF):
@@ -12,20 +64,9 @@ class PDF(fpdf.FPDF):
         self.include_diffs = include_diffs
         self.max_diff_lines = max_diff_lines
         # Default extensions if none provided
-        default_exts = [".py", ".c", ".cpp", ".md"]
-        if allowed_diff_exts:
-            # normalize to lowercase with leading dot
-            norm: list[str] = []
-            for e in allowed_diff_exts:
-                e = e.strip().lower()
-                if not e:
-                    continue
-                if not e.startswith('.'):
-                    e = '.' + e
-                norm.append(e)
-            self.allowed_diff_exts = tuple(norm)
-        else:
-            self.allowed_diff_exts = tuple(default_exts)
+        self.allowed_diff_exts = normalize_exts(allowed_diff_exts)
+        # Memoized character width tables, see _char_widths
+        self._width_tables: dict[tuple[str, float], tuple[float | None, dict[str, float] | None]] = {}
 
     # --- Text safety helpers -------------------------------------------------
     def _to_pdf_safe(self, text: str) -> str:
@@ -37,73 +78,40 @@ class PDF(fpdf.FPDF):
         """
         if not text:
             return ""
-
-        repl = {
-            "…": "...",
-            "—": "--",
-            "–": "-",
-            "―": "-",
-            "·": "*",
-            "•": "*",
-            "✓": "v",
-            "✔": "v",
-            "✗": "x",
-            "×": "x",
-            "→": "->",
-            "←": "<-",
-            "↔": "<->",
-            "⇒": "=>",
-            "⇐": "<=",
-            "⇔": "<=>",
-            "⟶": "->",
-            "’": "'",
-            "‘": "'",
-            "“": '"',
-            "”": '"',
-            "′": "'",
-            "″": '"',
-            " ": " ",  # NBSP
-            "	": "    ",
-        }
-
-        # Fast path: if it encodes, return as-is
-        try:
-            text.encode("latin-1")
+        # Plain ASCII (most diff rows) needs neither conversion nor a cache lookup
+        if text.isascii():
             return text
-        except Exception:
-            pass
-
-        # Apply simple replacements
-        out = text
-        for k, v in repl.items():
-            if k in out:
-                out = out.replace(k, v)
+        return _latin1_safe(text)
 
-        # Final fallback: lossy conversion with replacement
-        return out.encode("latin-1", "replace").decode("latin-1")
+    def add_commits(self, commits: list[Commit], *, start: int = 1, total: int | None = None) -> None:
+        """Add commits to the PDF document
 
-    def add_commits(self, commits: list[Commit]) -> None:
-        """Add commits to the PDF document"""
+        ``start`` and ``total`` let a report be rendered in chunks: commits are
+        numbered from ``start``, and the section title is only added for the
+        chunk that starts at 1.
+        """
         if not commits:
             return
+        total = total or len(commits)
 
-        # Add title
         self.add_page()
-        self.set_font("Helvetica", "B", 16)
-        self.cell(0, 10, "Commits Summary", ln=True, align="C")
-        self.ln(5)
+        if start == 1:
+            # Add title
+            self.set_font("Helvetica", "B", 16)
+            self.cell(0, 10, "Commits Summary", ln=True, align="C")
+            self.ln(5)
 
-        # Add commit count
-        self.set_font("Helvetica", "", 12)
-        self.cell(0, 8, f"Total Commits: {len(commits)}", ln=True)
-        self.ln(5)
+            # Add commit count
+            self.set_font("Helvetica", "", 12)
+            self.cell(0, 8, f"Total Commits: {total}", ln=True)
+            self.ln(5)
 
         # Add each commit
-        for i, commit in enumerate(commits, 1):
+        for i, commit in enumerate(commits, start):
             self._add_single_commit(commit, i)
 
             # Add some space between commits
-            if i < len(commits):
+            if i < total:
                 self.ln(3)
 
     def _add_single_commit(self, commit: Commit, index: int) -> None:
@@ -199,28 +207,33 @@ class PDF(fpdf.FPDF):
 
         return lines
 
-    def add_prs(self, prs: list[PullRequest]) -> None:
-        """Add pull requests to the PDF document"""
+    def add_prs(self, prs: list[PullRequest], *, start: int = 1, total: int | None = None) -> None:
+        """Add pull requests to the PDF document
+
+        ``start`` and ``total`` work as in ``add_commits``.
+        """
         if not prs:
             return
+        total = total or len(prs)
 
-        # Add title
         self.add_page()
-        self.set_font("Helvetica", "B", 16)
-        self.cell(0, 10, "Pull Requests Summary", ln=True, align="C")
-        self.ln(5)
+        if start == 1:
+            # Add title
+            self.set_font("Helvetica", "B", 16)
+            self.cell(0, 10, "Pull Requests Summary", ln=True, align="C")
+            self.ln(5)
 
-        # Add PR count
-        self.set_font("Helvetica", "", 12)
-        self.cell(0, 8, f"Total Pull Requests: {len(prs)}", ln=True)
-        self.ln(5)
+            # Add PR count
+            self.set_font("Helvetica", "", 12)
+            self.cell(0, 8, f"Total Pull Requests: {total}", ln=True)
+            self.ln(5)
 
         # Add each PR
-        for i, pr in enumerate(prs, 1):
+        for i, pr in enumerate(prs, start):
             self._add_single_pr(pr, i)
 
             # Add some space between PRs
-            if i < len(prs):
+            if i < total:
                 self.ln(3)
 
     def _add_single_pr(self, pr: PullRequest, index: int) -> None:
@@ -253,6 +266,18 @@ class PDF(fpdf.FPDF):
             formatted_date = merge_date.strftime("%Y-%m-%d %H:%M:%S")
             self.cell(0, 6, f"Merged: {formatted_date}", ln=True)
 
+        # Diff stats (GraphQL backend only)
+        if pr.additions is not None and pr.deletions is not None:
+            file_count = pr.changed_file_count if pr.changed_file_count is not None else len(pr.changed_files)
+            self.cell(0, 6, f"Changes: +{pr.additions} / -{pr.deletions} in {file_count} files", ln=True)
+            if pr.changed_files:
+                self.set_font("Courier", size=8)
+                for path in pr.changed_files[:20]:
+                    self.cell(0, 4, self._to_pdf_safe(path), ln=True)
+                if file_count > 20:
+                    self.cell(0, 4, f"... and {file_count - 20} more", ln=True)
+                self.set_font("Helvetica", "", 10)
+
         # Body/Description
         if pr.body:
             self.ln(2)
@@ -293,31 +318,14 @@ class PDF(fpdf.FPDF):
         - Colored backgrounds for additions/deletions
         - Line numbers
         - Truncation by max_diff_lines
+
+        The diff is parsed lazily, so rendering stops reading it once the line
+        limit is reached.
         """
         if not diff_text:
             return
 
-        files = self._parse_unified_diff(diff_text)
-
-        # Filter: include only code and markdown files
-        def _allowed(path: str) -> bool:
-            if not path:
-                return False
-            p = path.lower()
-            return any(p.endswith(ext) for ext in self.allowed_diff_exts)
-
-        filtered = []
-        for f in files:
-            path = f.get("b_path") or f.get("a_path") or f.get("display") or ""
-            if _allowed(path):
-                filtered.append(f)
-        files = filtered
-
-        if not files:
-            return
-
         # Layout constants
-        self.set_font("Courier", size=8)
         row_h = 4
         col_sign = 5
         col_old = 12
@@ -329,88 +337,49 @@ class PDF(fpdf.FPDF):
 
         processed_lines = 0
         line_limit = max(0, int(self.max_diff_lines))
+        rendered_any = False
 
-        for f in files:
-            # File header
-            if self.get_y() > self.h - 40:
+        # Files not matching allowed_diff_exts are dropped by the parser itself
+        for item in iter_unified_diff(diff_text, allowed_exts=self.allowed_diff_exts):
+            if line_limit and processed_lines >= line_limit:
+                break
+
+            if isinstance(item, DiffFile):
+                # small spacing between files
+                if rendered_any:
+                    self.ln(1)
+                rendered_any = True
+
+                # File header
+                if self.get_y() > self.h - 40:
+                    self.add_page()
+
+                self.set_font("Helvetica", "B", 9)
+                self.set_text_color(0, 0, 0)
+                self.cell(0, 5, self._to_pdf_safe(item.path), ln=True)
+                self.set_font("Courier", size=8)
+                continue
+
+            h = item
+            # Hunk header
+            if self.get_y() > self.h - 20:
                 self.add_page()
                 self.set_font("Courier", size=8)
+            self.set_fill_color(246, 248, 250)  # light gray
+            self.set_text_color(88, 96, 105)
+            header = self._to_pdf_safe(h.header_raw)  # may contain Unicode symbols
+            # Full-width header
+            self.cell(0, row_h, header, ln=True, fill=True)
 
-            self.set_font("Helvetica", "B", 9)
-            self.set_text_color(0, 0, 0)
-            display = f.get("display", f.get("b_path") or f.get("a_path") or f.get("name", ""))
-            self.cell(0, 5, self._to_pdf_safe(display), ln=True)
-            self.set_font("Courier", size=8)
+            rows = numbered_rows(h, line_limit - processed_lines if line_limit else 0)
+            processed_lines += len(rows)
 
-            for h in f.get("hunks", []):
-                if line_limit and processed_lines >= line_limit:
-                    break
+            self._render_diff_rows(rows, row_h, (col_sign, col_old, col_new, col_content), gap)
 
-                # Hunk header
-                if self.get_y() > self.h - 20:
-                    self.add_page()
-                    self.set_font("Courier", size=8)
-                self.set_fill_color(246, 248, 250)  # light gray
-                self.set_text_color(88, 96, 105)
-                header = self._to_pdf_safe(h["header_raw"])  # may contain Unicode symbols
-                # Full-width header
-                self.cell(0, row_h, header, ln=True, fill=True)
-
-                old_ln = h["old_start"]
-                new_ln = h["new_start"]
-
-                for kind, text in h["lines"]:
-                    if line_limit and processed_lines >= line_limit:
-                        break
-
-                    # Page break handling
-                    if self.get_y() > self.h - 20:
-                        self.add_page()
-                        self.set_font("Courier", size=8)
-
-                    # Determine style
-                    if kind == "+":
-                        fill = (230, 255, 237)  # green bg
-                        sign_color = (3, 102, 3)
-                        old_str = ""
-                        new_str = str(new_ln)
-                        new_ln += 1
-                    elif kind == "-":
-                        fill = (255, 238, 240)  # red bg
-                        sign_color = (158, 0, 6)
-                        old_str = str(old_ln)
-                        new_str = ""
-                        old_ln += 1
-                    else:  # context
-                        fill = (255, 255, 255)
-                        sign_color = (110, 119, 129)
-                        old_str = str(old_ln)
-                        new_str = str(new_ln)
-                        old_ln += 1
-                        new_ln += 1
-
-                    # Draw row: sign | old | new | content
-                    self.set_fill_color(*fill)
-                    # sign
-                    self.set_text_color(*sign_color)
-                    self.cell(col_sign, row_h, kind if kind in "+-" else " ", border=0, ln=0, fill=True)
-
-                    # line numbers
-                    self.set_text_color(110, 119, 129)
-                    self.cell(col_old, row_h, old_str, border=0, ln=0, fill=True, align="R")
-                    self.cell(gap, row_h, "", ln=0)
-                    self.cell(col_new, row_h, new_str, border=0, ln=0, fill=True, align="R")
-                    self.cell(gap, row_h, "", ln=0)
-
-                    # content (truncate to fit)
-                    self.set_text_color(0, 0, 0)
-                    content = self._truncate_to_width(text, col_content)
-                    self.cell(col_content, row_h, content, border=0, ln=1, fill=True)
-
-                    processed_lines += 1
-
-            # small spacing between files
-            self.ln(1)
+        if not rendered_any:
+            return
+
+        self.ln(1)
 
         if line_limit and processed_lines >= line_limit:
             self.set_text_color(100, 100, 100)
@@ -421,13 +390,143 @@ class PDF(fpdf.FPDF):
         self.set_text_color(0, 0, 0)
         self.set_font("Helvetica", size=11)
 
+    def _render_diff_rows(
+        self, rows: list[tuple[str, str, str, str]], row_h: float, cols: tuple[float, float, float, float], gap: float
+    ) -> None:
+        """Draw diff rows (kind, old, new, content) as sign | old | new | content columns.
+
+        Rows are drawn a page at a time: backgrounds of consecutive rows with the
+        same kind become one rectangle per column group, and each column's text
+        is emitted as a single PDF text object, instead of five cells per row.
+        """
+        col_sign, col_old, col_new, col_content = cols
+        x_sign = self.l_margin
+        x_old = x_sign + col_sign
+        x_new = x_old + col_old + gap
+        x_content = x_new + col_new + gap
+        baseline = 0.5 * row_h + 0.3 * self.font_size
+
+        start = 0
+        while start < len(rows):
+            # Page break handling: a row starts a new page once y passes h - 20
+            if self.get_y() > self.h - 20:
+                self.add_page()
+                self.set_font("Courier", size=8)
+            y0 = self.get_y()
+            fit = int((self.h - 20 - y0) / row_h + 1e-9) + 1
+            page_rows = rows[start : start + fit]
+
+            # Backgrounds: one rectangle per run of same-kind rows (context rows stay white)
+            run_start = 0
+            for i in range(1, len(page_rows) + 1):
+                if i < len(page_rows) and page_rows[i][0] == page_rows[run_start][0]:
+                    continue
+                kind = page_rows[run_start][0]
+                if kind in _DIFF_ROW_FILLS:
+                    self.set_fill_color(*_DIFF_ROW_FILLS[kind])
+                    y = y0 + run_start * row_h
+                    h = (i - run_start) * row_h
+                    self.rect(x_sign, y, col_sign + col_old, h, style="F")
+                    self.rect(x_new, y, col_new, h, style="F")
+                    self.rect(x_content, y, col_content, h, style="F")
+                run_start = i
+
+            signs, olds, news, contents = [], [], [], []
+            for i, (kind, old_str, new_str, text) in enumerate(page_rows):
+                y = y0 + i * row_h + baseline
+                if kind in "+-":
+                    signs.append((x_sign + self.c_margin, y, kind, _DIFF_SIGN_COLORS[kind]))
+                if old_str:
+                    x = x_old + col_old - self.c_margin - self.get_string_width(old_str)
+                    olds.append((x, y, old_str, _DIFF_LINENO_COLOR))
+                if new_str:
+                    x = x_new + col_new - self.c_margin - self.get_string_width(new_str)
+                    news.append((x, y, new_str, _DIFF_LINENO_COLOR))
+                content = self._truncate_to_width(text, col_content)
+                if content:
+                    contents.append((x_content + self.c_margin, y, content, (0, 0, 0)))
+            for column in (signs, olds, news, contents):
+                self._text_block(column)
+
+            self.set_y(y0 + len(page_rows) * row_h)
+            start += len(page_rows)
+
+    def _text_block(self, runs: list[tuple[float, float, str, tuple[int, int, int]]]) -> None:
+        """Emit many ``(x, baseline_y, text, rgb)`` strings as one PDF text object in the current font.
+
+        Relies on fpdf2 internals (``_out``, ``_set_font_for_page``, ``encode_text``), hence the
+        ``fpdf2>=2.8,<2.9`` pin in pyproject.toml.
+        """
+        if not runs:
+            return
+        if not self.current_font_is_set_on_page:
+            self._out(self._set_font_for_page(self.current_font, self.font_size_pt))
+        parts = ["q BT"]
+        color = None
+        for x, y, text, rgb in runs:
+            if rgb != color:
+                parts.append(f"{rgb[0] / 255:.4f} {rgb[1] / 255:.4f} {rgb[2] / 255:.4f} rg")
+                color = rgb
+            tm = f"1 0 0 1 {x * self.k:.2f} {(self.h - y) * self.k:.2f} Tm"
+            parts.append(f"{tm} {self.current_font.encode_text(text)}")
+        parts.append("ET Q")
+        self._out("\n".join(parts))
+
+    def _char_widths(self) -> tuple[float | None, dict[str, float] | None]:
+        """Return ``(fixed_width, widths)`` in user units for the current font.
+
+        ``fixed_width`` is set for monospace fonts (Courier, used for all diff
+        rows); otherwise ``widths`` maps each character to its width. Tables are
+        memoized per font and size. ``(None, None)`` means widths must be
+        measured with ``get_string_width`` (stretching/spacing, non-core fonts).
+        """
+        cw = getattr(self.current_font, "cw", None)
+        if not isinstance(cw, dict) or self.font_stretching != 100 or self.char_spacing:
+            return None, None
+
+        key = (getattr(self.current_font, "fontkey", self.font_family + self.font_style), self.font_size_pt)
+        cache = self._width_tables
+        if key not in cache:
+            scale = self.font_size_pt * 0.001 / self.k
+            values = set(cw.values())
+            if len(values) == 1:
+                cache[key] = (values.pop() * scale, None)
+            else:
+                cache[key] = (None, {c: w * scale for c, w in cw.items()})
+        return cache[key]
+
     def _truncate_to_width(self, text: str, width: float) -> str:
         """Truncate text with ellipsis so it fits within width in current font."""
         text = self._to_pdf_safe(text)
+        ell = "..."
+        fixed, widths = self._char_widths()
+
+        if fixed is not None:
+            # Monospace: the fitting prefix length is plain arithmetic
+            fit = int(width / fixed + 1e-9)
+            if len(text) <= fit:
+                return text
+            return text[: max(0, fit - len(ell))] + ell
+
+        if widths is not None:
+            default = widths.get("?", 0.0)
+            total = 0.0
+            for c in text:
+                total += widths.get(c, default)
+            if total <= width:
+                return text
+            # Longest prefix that fits together with the ellipsis
+            budget = width - sum(widths.get(c, default) for c in ell)
+            total = 0.0
+            for i, c in enumerate(text):
+                total += widths.get(c, default)
+                if total > budget:
+                    return text[:i] + ell
+            return text + ell
+
         if self.get_string_width(text) <= width:
             return text
         lo, hi = 0, len(text)
-        ell = "..."
         # Binary search longest prefix that fits with ellipsis
         while lo < hi:
             mid = (lo + hi + 1) // 2
@@ -437,53 +536,3 @@ class PDF(fpdf.FPDF):
             else:
                 hi = mid - 1
         return text[:lo] + ell
-
-    def _parse_unified_diff(self, diff_text: str) -> list[dict]:
-        """Parse unified diff text into a list of file dicts with hunks.
-
-        Returns: [{display, a_path, b_path, hunks:[{header_raw, old_start, new_start, lines:[(kind, text), ...]}]}]
-        """
-        files: list[dict] = []
-        cur: dict | None = None
-        hunks: list | None = None
-        lines = diff_text.splitlines()
-        for ln in lines:
-            if ln.startswith("diff --git "):
-                # push previous
-                if cur is not None:
-                    cur["hunks"] = hunks or []
-                    files.append(cur)
-                parts = ln.split()
-                a_path = parts[2][2:] if len(parts) > 2 else ""
-                b_path = parts[3][2:] if len(parts) > 3 else a_path
-                name = b_path or a_path
-                cur = {"a_path": a_path, "b_path": b_path, "display": name}
-                hunks = []
-            elif ln.startswith("@@ ") and cur is not None:
-                # parse hunk header
-                header_raw = ln
-                try:
-                    # @@ -old_start,old_count +new_start,new_count @@
-                    header = ln.split("@@")[1].strip()
-                    left, right = header.split(" ")[:2]
-                    old_start = int(left.split(",")[0].lstrip("-"))
-                    new_start = int(right.split(",")[0].lstrip("+"))
-                except Exception:
-                    old_start = new_start = 0
-                hunks.append({"header_raw": header_raw, "old_start": old_start, "new_start": new_start, "lines": []})
-            elif hunks is not None and hunks:
-                # lines within current hunk or headers before first hunk
-                if ln.startswith(("+", "-", " ")):
-                    kind = ln[0]
-                    text = ln[1:]
-                    hunks[-1]["lines"].append((kind, text))
-                else:
-                    # ignore misc headers like --- / +++ or index lines
-                    continue
-
-        # push last file
-        if cur is not None:
-            cur["hunks"] = hunks or []
-            files.append(cur)
-
-        return files
@@ -1,8 +1,9 @@
-import json
-import requests
-from typing import Any
+from typing import Any, Callable, Iterable
 from pydantic import BaseModel
 
+from .github import Collector, GitHubClient, batch_authors, iter_search_items, iter_search_windows, route_by_login
+from .graphql import iter_merged_pr_nodes
+
 
 class PullRequest(BaseModel):
     repo_url: str
@@ -13,6 +14,15 @@ class PullRequest(BaseModel):
     title: str
     body: str
     diff: str = ""
+    # Only populated by the GraphQL backend
+    additions: int | None = None
+    deletions: int | None = None
+    changed_file_count: int | None = None
+    changed_files: list[str] = []
+
+    @property
+    def repo_name(self) -> str:
+        return "/".join(self.repo_url.split("/")[-2:])
 
     @classmethod
     def from_json(cls, json_data: dict[str, Any]) -> "PullRequest":
@@ -26,31 +36,189 @@ class PullRequest(BaseModel):
             body=json_data["body"] or "",
         )
 
+    @classmethod
+    def from_graphql(cls, node: dict[str, Any]) -> "PullRequest":
+        repo_name = node["repository"]["nameWithOwner"]
+        return cls(
+            repo_url=f"https://api.github.com/repos/{repo_name}",
+            html_url=node["url"],
+            diff_url=f"{node['url']}.diff",
+            api_url=f"https://api.github.com/repos/{repo_name}/pulls/{node['number']}",
+            merged_at=node["mergedAt"],
+            title=node["title"],
+            body=node["body"] or "",
+            additions=node["additions"],
+            deletions=node["deletions"],
+            changed_file_count=node["changedFiles"],
+            changed_files=[f["path"] for f in (node.get("files") or {}).get("nodes", [])],
+        )
+
+    @staticmethod
+    def search_url(author: str | list[str], date_range: str | None = None) -> str:
+        authors = [author] if isinstance(author, str) else author
+        url = "https://api.github.com/search/issues?q=type:pr+is:merged+" + "+".join(f"author:{a}" for a in authors)
+        if date_range:
+            url += f"+merged:{date_range}"
+        return url
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[dict[str, Any]],
+        *,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[PullRequest], None] | None" = None,
+    ) -> "list[PullRequest]":
+        return cls.collect(
+            (cls.from_json(item) for item in items if item["state"] == "closed"),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+
+    @classmethod
+    def collect(
+        cls,
+        pull_requests: "Iterable[PullRequest]",
+        *,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[PullRequest], None] | None" = None,
+    ) -> "list[PullRequest]":
+        """De-duplicate and filter pull requests; ``on_item`` sees each kept one as soon as it arrives."""
+
+        collector = Collector(
+            lambda pr: pr.html_url,
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+        for pr in pull_requests:
+            collector.add(pr)
+            if collector.full:
+                break
+
+        return sorted(collector.items, key=lambda x: x.merged_at)
+
     @classmethod
     def from_url(
         cls,
         url: str,
         *,
         headers: dict[str, Any] | None = None,
+        client: GitHubClient | None = None,
         include_repos: tuple[str, ...] | None = None,
         exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[PullRequest], None] | None" = None,
     ) -> "list[PullRequest]":
-        res = requests.get(url, headers=headers)
-        data = json.loads(res.text)
-
-        def should_include_repo(repo_url: str) -> bool:
-            repo_name = "/".join(repo_url.split("/")[-2:])
-            if include_repos:
-                return repo_name in include_repos
-            if exclude_repos:
-                return repo_name not in exclude_repos
-            return True
-
-        return sorted(
-            [
-                cls.from_json(item)
-                for item in data["items"]
-                if item["state"] == "closed" and should_include_repo(item["repository_url"])
-            ],
-            key=lambda x: x.merged_at,
+        return cls.from_items(
+            iter_search_items(client or GitHubClient(), url, headers=headers),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
         )
+
+    @classmethod
+    def from_search(
+        cls,
+        author: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        headers: dict[str, Any] | None = None,
+        client: GitHubClient | None = None,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[PullRequest], None] | None" = None,
+    ) -> "list[PullRequest]":
+        """Search merged PRs by ``author``, splitting the date range past the 1000-result cap."""
+        items = iter_search_windows(
+            client or GitHubClient(),
+            lambda date_range: cls.search_url(author, date_range),
+            start_date=start_date,
+            end_date=end_date,
+            headers=headers,
+        )
+        return cls.from_items(
+            items,
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+
+    @classmethod
+    def from_graphql_search(
+        cls,
+        author: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        client: GitHubClient | None = None,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_item: "Callable[[PullRequest], None] | None" = None,
+    ) -> "list[PullRequest]":
+        """Search merged PRs by ``author`` through GraphQL, including diff stats and changed files."""
+        nodes = iter_merged_pr_nodes(client or GitHubClient(), author, start_date=start_date, end_date=end_date)
+        return cls.collect(
+            (cls.from_graphql(node) for node in nodes),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+            on_item=on_item,
+        )
+
+    @classmethod
+    def from_search_many(
+        cls,
+        authors: list[str],
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        headers: dict[str, Any] | None = None,
+        client: GitHubClient | None = None,
+        include_repos: tuple[str, ...] | None = None,
+        exclude_repos: tuple[str, ...] | None = None,
+        max_results: int | None = None,
+        on_items: "dict[str, Callable[[PullRequest], None]] | None" = None,
+    ) -> "dict[str, list[PullRequest]]":
+        """Search several authors with a few combined ``author:a author:b ...`` queries.
+
+        Results are split back up by the PR author's login. ``max_results`` applies per author.
+        """
+        client = client or GitHubClient()
+        collectors = {
+            author: Collector(
+                lambda pr: pr.html_url,
+                include_repos=include_repos,
+                exclude_repos=exclude_repos,
+                max_results=max_results,
+                on_item=(on_items or {}).get(author),
+            )
+            for author in authors
+        }
+        for batch in batch_authors(authors):
+            items = iter_search_windows(
+                client,
+                lambda date_range, batch=batch: cls.search_url(batch, date_range),
+                start_date=start_date,
+                end_date=end_date,
+                headers=headers,
+            )
+            # Items are handed to their author's collector as pages arrive
+            for author, item in route_by_login(items, batch, lambda item: (item.get("user") or {}).get("login")):
+                if item["state"] == "closed":
+                    collectors[author].add(cls.from_json(item))
+                if all(collectors[a].full for a in batch):
+                    break
+        return {author: sorted(c.items, key=lambda x: x.merged_at) for author, c in collectors.items()}
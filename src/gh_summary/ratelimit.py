@@ -0,0 +1,114 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+API_HOST = "api.github.com"
+
+
+def resource_for_url(url: str) -> str | None:
+    """Return the GitHub rate-limit resource a request to ``url`` is billed to.
+
+    Requests outside api.github.com (e.g. ``.diff`` fallbacks on github.com)
+    are not tracked and return ``None``.
+    """
+    parsed = urlparse(url)
+    if parsed.hostname != API_HOST:
+        return None
+    if parsed.path.startswith("/search/"):
+        return "search"
+    if parsed.path.startswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+class RateLimiter:
+    """Shared request scheduler driven by GitHub's ``X-RateLimit-*`` headers.
+
+    Budgets are tracked per resource (``core``, ``search``, ...). Once a
+    resource is nearly exhausted, requests are spread over the time left until
+    the reset; once it is exhausted, callers sleep until the reset.
+    """
+
+    def __init__(self, *, pace_below: int = 10, max_retries: int = 5, max_backoff: float = 60.0) -> None:
+        self.pace_below = pace_below
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._remaining: dict[str, int] = {}
+        self._reset: dict[str, float] = {}
+        self._last_request: dict[str, float] = {}
+
+    def reserve(self, resource: str | None) -> float:
+        """Claim a request against ``resource`` and return how many seconds to wait before sending it."""
+        if resource is None:
+            return 0.0
+
+        with self._lock:
+            remaining = self._remaining.get(resource)
+            reset = self._reset.get(resource, 0.0)
+            now = time.time()
+            wait = 0.0
+            if remaining is not None and reset > now:
+                if remaining <= 0:
+                    wait = reset - now + 1
+                elif remaining < self.pace_below:
+                    interval = (reset - now) / remaining
+                    wait = max(0.0, self._last_request.get(resource, 0.0) + interval - now)
+                    self._remaining[resource] = remaining - 1
+                else:
+                    self._remaining[resource] = remaining - 1
+            self._last_request[resource] = now + wait
+            return wait
+
+    def acquire(self, resource: str | None) -> None:
+        """Block until a request against ``resource`` may be sent."""
+        wait = self.reserve(resource)
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, resource: str | None, res: requests.Response) -> None:
+        """Record the budget reported by a response."""
+        resource = res.headers.get("X-RateLimit-Resource") or resource
+        if resource is None or "X-RateLimit-Remaining" not in res.headers:
+            return
+
+        try:
+            remaining = int(res.headers["X-RateLimit-Remaining"])
+            reset = float(res.headers.get("X-RateLimit-Reset", 0))
+        except ValueError:
+            return
+
+        with self._lock:
+            # Concurrent responses may arrive out of order; keep the lowest budget per window
+            if self._reset.get(resource) == reset:
+                remaining = min(remaining, self._remaining.get(resource, remaining))
+            self._remaining[resource] = remaining
+            self._reset[resource] = reset
+
+    def retry_delay(self, res: requests.Response, attempt: int) -> float | None:
+        """Return how long to wait before retrying ``res``, or ``None`` if it should not be retried."""
+        if attempt >= self.max_retries or res.status_code not in (403, 429):
+            return None
+
+        retry_after = res.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        if res.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                return max(0.0, float(res.headers["X-RateLimit-Reset"]) - time.time()) + 1
+            except (KeyError, ValueError):
+                pass
+
+        # A 403 without rate-limit signals is a real permission error
+        if res.status_code == 403 and "rate limit" not in res.text.lower():
+            return None
+
+        # Secondary rate limits: exponential backoff with full jitter
+        return random.uniform(0, min(self.max_backoff, 2 ** (attempt + 1)))
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .commit import Commit
+from .pdf import PDF
+from .pr import PullRequest
+
+# (section, items, start index, section total)
+Chunk = tuple[str, list[Any], int, int]
+
+
+def plan_chunks(prs: list[PullRequest], commits: list[Commit], chunk_size: int) -> list[Chunk]:
+    """Split the report into chunks of at most ``chunk_size`` items, PRs first like ``main()``."""
+    chunks: list[Chunk] = []
+    for section, items in (("prs", prs), ("commits", commits)):
+        for offset in range(0, len(items), chunk_size):
+            chunks.append((section, items[offset : offset + chunk_size], offset + 1, len(items)))
+    return chunks
+
+
+def render_chunk(chunk: Chunk, path: str, pdf_options: dict[str, Any]) -> str:
+    """Render one chunk into its own PDF file at ``path``."""
+    section, items, start, total = chunk
+    pdf = PDF(**pdf_options)
+    if section == "prs":
+        pdf.add_prs(items, start=start, total=total)
+    else:
+        pdf.add_commits(items, start=start, total=total)
+    pdf.output(path)
+    return path
+
+
+def require_pypdf() -> None:
+    """Raise ``ImportError`` with install instructions unless pypdf is available."""
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        raise ImportError("Chunked PDF output requires pypdf. Install it with: pip install 'gh-summary[chunked]'")
+
+
+def merge_pdfs(paths: list[str], save_path: str) -> None:
+    """Concatenate ``paths`` into ``save_path``.
+
+    pypdf keeps every page in its writer until ``write()``, so this step still
+    holds the whole document once.
+    """
+    require_pypdf()
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(path)
+    with open(save_path, "wb") as f:
+        writer.write(f)
+    writer.close()
+
+
+def render_chunked(
+    save_path: str,
+    prs: list[PullRequest],
+    commits: list[Commit],
+    *,
+    pdf_options: dict[str, Any],
+    chunk_size: int = 0,
+    workers: int = 1,
+) -> None:
+    """Render the report chunk by chunk and concatenate the pieces into ``save_path``.
+
+    Each chunk is written to a temporary PDF as soon as it is rendered, so the
+    in-memory fpdf document never holds more than ``chunk_size`` items; the
+    final merge still loads every page (see ``merge_pdfs``). With
+    ``workers > 1`` chunks are rendered in parallel processes; without an
+    explicit ``chunk_size`` the items are then split into a few chunks per
+    worker so that a handful of large diffs does not leave the other cores idle.
+    """
+    # Fail before rendering anything rather than at the merge
+    require_pypdf()
+    if chunk_size <= 0:
+        chunk_size = max(1, -(-(len(prs) + len(commits)) // (max(1, workers) * 4)))
+    chunks = plan_chunks(prs, commits, chunk_size)
+    if not chunks:
+        PDF(**pdf_options).output(save_path)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="gh-summary-") as tmp:
+        paths = [os.path.join(tmp, f"{i:05d}.pdf") for i in range(len(chunks))]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # map() yields in submission order, so the merge keeps the report order
+                paths = list(pool.map(render_chunk, chunks, paths, [pdf_options] * len(chunks)))
+        else:
+            paths = [render_chunk(chunk, path, pdf_options) for chunk, path in zip(chunks, paths)]
+        merge_pdfs(paths, save_path)
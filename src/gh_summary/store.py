@@ -0,0 +1,226 @@
+import os
+import sqlite3
+from datetime import date
+
+from .cache import default_cache_dir
+from .commit import Commit
+from .github import SEARCH_EPOCH
+from .pr import PullRequest
+
+# Bump when the tables change; older stores are then rebuilt from scratch
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    author TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    day TEXT NOT NULL,
+    data TEXT NOT NULL,
+    diff TEXT NOT NULL DEFAULT '',
+    diff_key TEXT,
+    PRIMARY KEY (author, repo_name, sha)
+);
+CREATE TABLE IF NOT EXISTS prs (
+    author TEXT NOT NULL,
+    html_url TEXT NOT NULL,
+    day TEXT NOT NULL,
+    data TEXT NOT NULL,
+    diff TEXT NOT NULL DEFAULT '',
+    diff_key TEXT,
+    PRIMARY KEY (author, html_url)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    author TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    since TEXT NOT NULL,
+    until TEXT NOT NULL,
+    PRIMARY KEY (author, kind)
+);
+"""
+
+
+def _commit_day(commit: Commit) -> str:
+    # The commit search filters on the author date, so commits are filed under it too
+    return (commit.author_date or commit.date)[:10]
+
+
+class ItemStore:
+    """SQLite store of fetched commits and PRs (with their diffs) per author.
+
+    Commits are filed under their author date and PRs under their merge date,
+    the dates the searches filter on. Each diff is saved with the
+    ``DiffLimits.key`` it was trimmed with, and is only handed back to a run
+    that asks for the same limits.
+
+    For every author and kind (``"commits"`` / ``"prs"``, or ``"prs-graphql"``)
+    the store remembers the span of days that has been searched completely.
+    ``fetch_start`` uses it to narrow the next search to the days after that
+    high-water mark, and the report is then assembled from the store. Search
+    results are stored unfiltered, so the coverage holds for any repository
+    filter; filters are applied when reading the items back.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        directory = path or default_cache_dir()
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "items.sqlite3")
+        self._db = sqlite3.connect(self.path)
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            self._db.executescript(
+                "DROP TABLE IF EXISTS commits; DROP TABLE IF EXISTS prs; DROP TABLE IF EXISTS coverage;"
+                f"PRAGMA user_version = {_SCHEMA_VERSION};"
+            )
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ItemStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _coverage(self, author: str, kind: str) -> tuple[str, str] | None:
+        row = self._db.execute(
+            "SELECT since, until FROM coverage WHERE author = ? AND kind = ?", (author.lower(), kind)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def fetch_start(self, author: str, kind: str, *, start_date: str | None, end_date: str | None) -> str | None:
+        """Return the first day that still has to be searched for ``[start_date, end_date]``.
+
+        Returns ``start_date`` when the store does not cover the start of the
+        range, the high-water mark when it does (that day is searched again,
+        since it may have been incomplete), and ``None`` when the whole range
+        is already covered.
+        """
+        coverage = self._coverage(author, kind)
+        start = start_date or SEARCH_EPOCH.isoformat()
+        if coverage is None or not coverage[0] <= start <= coverage[1]:
+            return start_date
+        if end_date and end_date < coverage[1]:
+            return None
+        return coverage[1]
+
+    def _mark(self, author: str, kind: str, start_date: str | None, end_date: str | None) -> None:
+        start = start_date or SEARCH_EPOCH.isoformat()
+        # Today may still gain items, so it is never past the high-water mark
+        end = min(end_date or date.today().isoformat(), date.today().isoformat())
+        coverage = self._coverage(author, kind)
+        if coverage is not None and coverage[0] <= start <= coverage[1]:
+            start, end = coverage[0], max(end, coverage[1])
+        self._db.execute(
+            "INSERT OR REPLACE INTO coverage (author, kind, since, until) VALUES (?, ?, ?, ?)",
+            (author.lower(), kind, start, end),
+        )
+
+    def _put_commits(self, author: str, commits: list[Commit]) -> None:
+        # Diffs live in their own columns and are only written by put_diffs
+        self._db.executemany(
+            "INSERT INTO commits (author, repo_name, sha, day, data) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (author, repo_name, sha) DO UPDATE SET day = excluded.day, data = excluded.data",
+            [
+                (author.lower(), c.repo_name, c.sha, _commit_day(c), c.model_dump_json(exclude={"diff"}))
+                for c in commits
+            ],
+        )
+
+    def _put_prs(self, author: str, prs: list[PullRequest]) -> None:
+        self._db.executemany(
+            "INSERT INTO prs (author, html_url, day, data) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (author, html_url) DO UPDATE SET day = excluded.day, data = excluded.data",
+            [(author.lower(), pr.html_url, pr.merged_at[:10], pr.model_dump_json(exclude={"diff"})) for pr in prs],
+        )
+
+    def mark_fetched(self, author: str, kind: str, *, start_date: str | None, end_date: str | None) -> None:
+        """Record that ``[start_date, end_date]`` has been searched, extending adjacent coverage."""
+        with self._db:
+            self._mark(author, kind, start_date, end_date)
+
+    def record_commits(
+        self, author: str, commits: list[Commit], *, start_date: str | None, end_date: str | None, complete: bool
+    ) -> None:
+        """Save the commits of a search and, if it was ``complete``, mark its range as searched.
+
+        Both happen in one transaction, so a range is never marked as searched
+        without its items having been saved.
+        """
+        with self._db:
+            self._put_commits(author, commits)
+            if complete:
+                self._mark(author, "commits", start_date, end_date)
+
+    def record_prs(
+        self,
+        author: str,
+        prs: list[PullRequest],
+        *,
+        start_date: str | None,
+        end_date: str | None,
+        complete: bool,
+        kind: str = "prs",
+    ) -> None:
+        """Like ``record_commits``, for merged PRs; ``kind`` tells apart the search backends."""
+        with self._db:
+            self._put_prs(author, prs)
+            if complete:
+                self._mark(author, kind, start_date, end_date)
+
+    def put_commits(self, author: str, commits: list[Commit]) -> None:
+        with self._db:
+            self._put_commits(author, commits)
+
+    def put_prs(self, author: str, prs: list[PullRequest]) -> None:
+        with self._db:
+            self._put_prs(author, prs)
+
+    def put_diffs(self, author: str, items: list[Commit] | list[PullRequest], diff_key: str) -> None:
+        """Save the diffs of already stored ``items``, trimmed with the limits ``diff_key`` describes."""
+        commits = [(c.diff, diff_key, author.lower(), c.repo_name, c.sha) for c in items if isinstance(c, Commit)]
+        prs = [(pr.diff, diff_key, author.lower(), pr.html_url) for pr in items if isinstance(pr, PullRequest)]
+        with self._db:
+            self._db.executemany(
+                "UPDATE commits SET diff = ?, diff_key = ? WHERE author = ? AND repo_name = ? AND sha = ?", commits
+            )
+            self._db.executemany("UPDATE prs SET diff = ?, diff_key = ? WHERE author = ? AND html_url = ?", prs)
+
+    def _select(
+        self, table: str, author: str, start_date: str | None, end_date: str | None, diff_key: str | None
+    ) -> list[tuple[str, str]]:
+        rows = self._db.execute(
+            f"SELECT data, CASE WHEN diff_key = ? THEN diff ELSE '' END FROM {table}"
+            " WHERE author = ? AND day >= ? AND day <= ? ORDER BY day",
+            (diff_key, author.lower(), start_date or "", end_date or "9999-12-31"),
+        )
+        return rows.fetchall()
+
+    def commits(
+        self,
+        author: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        diff_key: str | None = None,
+    ) -> list[Commit]:
+        """Return the stored commits; only diffs saved with ``diff_key`` are filled in."""
+        return [
+            Commit.model_validate_json(data).model_copy(update={"diff": diff})
+            for data, diff in self._select("commits", author, start_date, end_date, diff_key)
+        ]
+
+    def prs(
+        self,
+        author: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        diff_key: str | None = None,
+    ) -> list[PullRequest]:
+        """Return the stored PRs; only diffs saved with ``diff_key`` are filled in."""
+        return [
+            PullRequest.model_validate_json(data).model_copy(update={"diff": diff})
+            for data, diff in self._select("prs", author, start_date, end_date, diff_key)
+        ]
@@ -0,0 +1,252 @@
+import html
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from .commit import Commit
+from .diff import DiffFile, DiffRow, Hunk, iter_unified_diff, normalize_exts, numbered_rows
+from .pr import PullRequest
+
+
+def _format_date(value: str) -> str:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class _TextReport(ABC):
+    """Common part of the text-based reports, with the same interface as ``PDF``.
+
+    Subclasses emit markup for the individual pieces; the diff is walked the
+    same way as ``PDF._render_github_style_diff``, so file filtering and
+    ``max_diff_lines`` truncation match the PDF exactly.
+    """
+
+    def __init__(self, *, include_diffs: bool = False, max_diff_lines: int = 200, allowed_diff_exts: list[str] | None = None):
+        self.include_diffs = include_diffs
+        self.max_diff_lines = max_diff_lines
+        self.allowed_diff_exts = normalize_exts(allowed_diff_exts)
+        self._parts: list[str] = []
+
+    def add_commits(self, commits: list[Commit], *, start: int = 1, total: int | None = None) -> None:
+        if not commits:
+            return
+        if start == 1:
+            self._section("Commits Summary", f"Total Commits: {total or len(commits)}")
+        for i, commit in enumerate(commits, start):
+            self._item(
+                f"Commit #{i}",
+                [
+                    ("Repository", commit.repo_name),
+                    ("Commit ID", commit.sha),
+                    ("Date", _format_date(commit.date)),
+                    ("Author", commit.author),
+                ],
+                [("Message", commit.message)],
+                [("URL", commit.html_url)],
+            )
+            if self.include_diffs and commit.diff:
+                self._diff(commit.diff)
+
+    def add_prs(self, prs: list[PullRequest], *, start: int = 1, total: int | None = None) -> None:
+        if not prs:
+            return
+        if start == 1:
+            self._section("Pull Requests Summary", f"Total Pull Requests: {total or len(prs)}")
+        for i, pr in enumerate(prs, start):
+            fields = [("Repository", pr.repo_name), ("Title", pr.title)]
+            if pr.merged_at:
+                fields.append(("Merged", _format_date(pr.merged_at)))
+            if pr.additions is not None and pr.deletions is not None:
+                file_count = pr.changed_file_count if pr.changed_file_count is not None else len(pr.changed_files)
+                fields.append(("Changes", f"+{pr.additions} / -{pr.deletions} in {file_count} files"))
+            self._item(
+                f"Pull Request #{i}",
+                fields,
+                [("Description", pr.body)] if pr.body else [],
+                [("PR URL", pr.html_url), ("Diff URL", pr.diff_url)],
+                files=pr.changed_files,
+            )
+            if self.include_diffs and pr.diff:
+                self._diff(pr.diff)
+
+    def output(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self._header())
+            f.writelines(self._parts)
+            f.write(self._footer())
+
+    def _diff(self, diff_text: str) -> None:
+        processed_lines = 0
+        line_limit = max(0, int(self.max_diff_lines))
+        rendered_any = False
+        for item in iter_unified_diff(diff_text, allowed_exts=self.allowed_diff_exts):
+            if line_limit and processed_lines >= line_limit:
+                break
+            if isinstance(item, DiffFile):
+                if rendered_any:
+                    self._diff_file_end()
+                rendered_any = True
+                self._diff_file(item)
+                continue
+            rows = numbered_rows(item, line_limit - processed_lines if line_limit else 0)
+            processed_lines += len(rows)
+            self._diff_hunk(item, rows)
+
+        if rendered_any:
+            self._diff_file_end()
+            if line_limit and processed_lines >= line_limit:
+                self._parts.append(self._truncated())
+
+    # --- Markup, implemented by subclasses -----------------------------------
+    def _header(self) -> str:
+        return ""
+
+    def _footer(self) -> str:
+        return ""
+
+    @abstractmethod
+    def _section(self, title: str, count: str) -> None:
+        ...
+
+    @abstractmethod
+    def _item(
+        self,
+        heading: str,
+        fields: list[tuple[str, str]],
+        texts: list[tuple[str, str]],
+        links: list[tuple[str, str]],
+        files: list[str] | None = None,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def _diff_file(self, diff_file: DiffFile) -> None:
+        ...
+
+    @abstractmethod
+    def _diff_hunk(self, hunk: Hunk, rows: list[DiffRow]) -> None:
+        ...
+
+    def _diff_file_end(self) -> None:
+        pass
+
+    @abstractmethod
+    def _truncated(self) -> str:
+        ...
+
+
+_HTML_STYLE = """
+body { font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif; max-width: 980px; margin: 2em auto; }
+h1 { text-align: center; }
+.meta { color: #646464; }
+.message { white-space: pre-wrap; }
+.files { font-family: monospace; font-size: 12px; }
+.diff-file { font-weight: bold; margin: 1em 0 0.25em; }
+table.diff { border-collapse: collapse; width: 100%; font: 12px monospace; }
+table.diff td { padding: 0 4px; white-space: pre-wrap; vertical-align: top; }
+table.diff td.num { color: #6e7781; text-align: right; width: 3em; user-select: none; }
+table.diff td.sign { width: 1em; user-select: none; }
+table.diff tr.hunk td { background: #f6f8fa; color: #586069; }
+table.diff tr.add td { background: #e6ffed; }
+table.diff tr.add td.sign { color: #036603; }
+table.diff tr.del td { background: #ffeef0; }
+table.diff tr.del td.sign { color: #9e0006; }
+.truncated { color: #646464; font-size: 12px; }
+"""
+
+_HTML_ROW_CLASSES = {"+": "add", "-": "del", " ": "ctx"}
+
+
+class HTMLReport(_TextReport):
+    """Single-file HTML report with GitHub-style diffs."""
+
+    def _header(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>GitHub Summary</title>\n'
+            f"<style>{_HTML_STYLE}</style>\n</head>\n<body>\n"
+        )
+
+    def _footer(self) -> str:
+        return "</body>\n</html>\n"
+
+    def _section(self, title: str, count: str) -> None:
+        self._parts.append(f"<h1>{html.escape(title)}</h1>\n<p>{html.escape(count)}</p>\n")
+
+    def _item(
+        self,
+        heading: str,
+        fields: list[tuple[str, str]],
+        texts: list[tuple[str, str]],
+        links: list[tuple[str, str]],
+        files: list[str] | None = None,
+    ) -> None:
+        out = [f"<hr>\n<h2>{html.escape(heading)}</h2>\n"]
+        for label, value in fields:
+            out.append(f"<div><b>{label}:</b> {html.escape(value)}</div>\n")
+        if files:
+            out.append('<div class="files">' + "<br>".join(html.escape(p) for p in files) + "</div>\n")
+        for label, value in texts:
+            out.append(f'<p><b>{label}:</b></p>\n<div class="message">{html.escape(value)}</div>\n')
+        for label, url in links:
+            out.append(f'<div class="meta">{label}: <a href="{html.escape(url)}">{html.escape(url)}</a></div>\n')
+        self._parts.append("".join(out))
+
+    def _diff_file(self, diff_file: DiffFile) -> None:
+        self._parts.append(f'<div class="diff-file">{html.escape(diff_file.path)}</div>\n<table class="diff">\n')
+
+    def _diff_hunk(self, hunk: Hunk, rows: list[DiffRow]) -> None:
+        out = [f'<tr class="hunk"><td colspan="4">{html.escape(hunk.header_raw)}</td></tr>\n']
+        for kind, old, new, text in rows:
+            out.append(
+                f'<tr class="{_HTML_ROW_CLASSES.get(kind, "ctx")}"><td class="sign">{html.escape(kind)}</td>'
+                f'<td class="num">{old}</td><td class="num">{new}</td><td>{html.escape(text)}</td></tr>\n'
+            )
+        self._parts.append("".join(out))
+
+    def _diff_file_end(self) -> None:
+        self._parts.append("</table>\n")
+
+    def _truncated(self) -> str:
+        return '<p class="truncated">... diff truncated (line limit)</p>\n'
+
+
+class MarkdownReport(_TextReport):
+    """GitHub-flavored Markdown report; diffs are ``diff`` code blocks with line numbers after the sign."""
+
+    def _section(self, title: str, count: str) -> None:
+        self._parts.append(f"# {title}\n\n{count}\n\n")
+
+    def _item(
+        self,
+        heading: str,
+        fields: list[tuple[str, str]],
+        texts: list[tuple[str, str]],
+        links: list[tuple[str, str]],
+        files: list[str] | None = None,
+    ) -> None:
+        out = [f"## {heading}\n\n"]
+        for label, value in fields:
+            out.append(f"- **{label}:** {value}\n")
+        for path in files or ():
+            out.append(f"  - `{path}`\n")
+        out.append("\n")
+        for label, value in texts:
+            out.append(f"**{label}:**\n\n{value.strip()}\n\n")
+        for label, url in links:
+            out.append(f"{label}: <{url}>  \n")
+        out.append("\n")
+        self._parts.append("".join(out))
+
+    def _diff_file(self, diff_file: DiffFile) -> None:
+        self._parts.append(f"**{diff_file.path}**\n\n```diff\n")
+
+    def _diff_hunk(self, hunk: Hunk, rows: list[DiffRow]) -> None:
+        # The sign stays in the first column so GitHub still colors the row
+        out = [hunk.header_raw, "\n"]
+        for kind, old, new, text in rows:
+            out.append(f"{kind}{old:>5} {new:>5} | {text}\n")
+        self._parts.append("".join(out))
+
+    def _diff_file_end(self) -> None:
+        self._parts.append("```\n\n")
+
+    def _truncated(self) -> str:
+        return "_... diff truncated (line limit)_\n\n"
@@ -0,0 +1,24 @@
+import os
+
+from gh_summary.cache import DiffCache, ResponseStore
+
+
+def test_response_store_evicts_least_recently_used(tmp_path):
+    store = ResponseStore(str(tmp_path), max_bytes=20_000)
+    store.put("first", {"body": "kept"})
+    for i in range(100):
+        store.get("first")
+        store.put(f"key{i}", {"body": os.urandom(200).hex()})
+
+    assert store.get("first") == {"body": "kept"}
+    assert store.get("key0") is None
+    assert store.get("key99") is not None
+    assert store._scan_size() <= store.max_bytes
+
+
+def test_diff_cache_round_trip(tmp_path):
+    cache = DiffCache(str(tmp_path))
+    cache.put("abc123", "+héllo\r\n", "variant")
+
+    assert cache.get("ABC123", "variant") == "+héllo\r\n"
+    assert cache.get("abc123") is None
@@ -0,0 +1,37 @@
+from gh_summary import __main__ as cli
+from gh_summary.commit import Commit
+from gh_summary.diff import DiffLimits
+
+
+def make_commit(sha: str, repo_name: str) -> Commit:
+    return Commit(
+        sha=sha,
+        html_url=f"https://github.com/{repo_name}/commit/{sha}",
+        repo_url=f"https://github.com/{repo_name}",
+        repo_name=repo_name,
+        author="a",
+        committer="c",
+        date="2024-01-10T00:00:00Z",
+        message="m",
+    )
+
+
+def test_share_items_matches_commits_by_sha_across_forks():
+    upstream, fork = make_commit("abc", "o/r"), make_commit("abc", "fork/r")
+    results = {"a": ([upstream, fork], []), "b": ([make_commit("abc", "fork/r"), make_commit("def", "o/r")], [])}
+
+    commits, prs = cli.share_items(results)
+
+    assert [c.sha for c in commits] == ["abc", "def"]
+    assert results["a"][0] == [upstream]
+    assert results["b"][0][0] is upstream
+    assert cli.DiffPipeline._key(upstream) == cli.DiffPipeline._key(fork)
+
+
+def test_diff_pipeline_key_includes_the_source():
+    limits = DiffLimits(max_lines=10)
+    unified = cli.DiffPipeline(None, limits=limits, source="unified")
+    files = cli.DiffPipeline(None, limits=limits, source="files")
+
+    assert unified.key != files.key
+    assert unified.key.endswith(limits.key)
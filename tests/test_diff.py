@@ -0,0 +1,198 @@
+from gh_summary.diff import (
+    DiffFile,
+    DiffLimits,
+    DiffReader,
+    Hunk,
+    iter_lines,
+    iter_unified_diff,
+    numbered_rows,
+    read_diff,
+)
+
+SAMPLE_DIFF = """\
+diff --git a/src/app.py b/src/app.py
+index 83db48f..bf269f4 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,4 +1,5 @@ import os
+ import os
+-import sys
++import re
++import sys
+ 
+ def main():
+@@ -20,3 +21,2 @@ def main():
+     run()
+-    cleanup()
+     return 0
+diff --git a/docs/guide.md b/docs/guide.md
+index 1111111..2222222 100644
+--- a/docs/guide.md
++++ b/docs/guide.md
+@@ -7 +7 @@
+-Old line
++New line
+\\ No newline at end of file
+diff --git a/logo.png b/logo.png
+Binary files a/logo.png and b/logo.png differ
+diff --git a/lib/util.js b/lib/util.js
+--- a/lib/util.js
++++ b/lib/util.js
+@@ -3,2 +3,3 @@
+ const a = 1;
++const b = 2;
+ module.exports = a;
+"""
+
+
+def parse_unified_diff_reference(diff_text: str) -> list[dict]:
+    """The parser ``iter_unified_diff`` replaced (``PDF._parse_unified_diff``), kept as a reference."""
+    files: list[dict] = []
+    cur: dict | None = None
+    hunks: list | None = None
+    for ln in diff_text.splitlines():
+        if ln.startswith("diff --git "):
+            if cur is not None:
+                cur["hunks"] = hunks or []
+                files.append(cur)
+            parts = ln.split()
+            a_path = parts[2][2:] if len(parts) > 2 else ""
+            b_path = parts[3][2:] if len(parts) > 3 else a_path
+            cur = {"a_path": a_path, "b_path": b_path, "display": b_path or a_path}
+            hunks = []
+        elif ln.startswith("@@ ") and cur is not None:
+            try:
+                header = ln.split("@@")[1].strip()
+                left, right = header.split(" ")[:2]
+                old_start = int(left.split(",")[0].lstrip("-"))
+                new_start = int(right.split(",")[0].lstrip("+"))
+            except Exception:
+                old_start = new_start = 0
+            hunks.append({"header_raw": ln, "old_start": old_start, "new_start": new_start, "lines": []})
+        elif hunks and ln.startswith(("+", "-", " ")):
+            hunks[-1]["lines"].append((ln[0], ln[1:]))
+    if cur is not None:
+        cur["hunks"] = hunks or []
+        files.append(cur)
+    return files
+
+
+def flatten(items) -> list[tuple]:
+    out = []
+    for item in items:
+        if isinstance(item, DiffFile):
+            out.append(("file", item.path))
+        else:
+            out.append(("hunk", item.header_raw, item.old_start, item.new_start, numbered_rows(item)))
+    return out
+
+
+def test_iter_unified_diff_matches_the_previous_parser():
+    expected = []
+    for f in parse_unified_diff_reference(SAMPLE_DIFF):
+        expected.append(("file", f["display"]))
+        for h in f["hunks"]:
+            hunk = Hunk(h["header_raw"], h["old_start"], h["new_start"], h["lines"])
+            expected.append(("hunk", h["header_raw"], h["old_start"], h["new_start"], numbered_rows(hunk)))
+
+    assert flatten(iter_unified_diff(SAMPLE_DIFF)) == expected
+    # Any iterable of lines parses the same as the text
+    assert flatten(iter_unified_diff(SAMPLE_DIFF.splitlines(keepends=True))) == expected
+
+
+def test_hunk_rows_are_numbered_like_github():
+    hunk = next(item for item in iter_unified_diff(SAMPLE_DIFF) if isinstance(item, Hunk))
+
+    assert numbered_rows(hunk) == [
+        (" ", "1", "1", "import os"),
+        ("-", "2", "", "import sys"),
+        ("+", "", "2", "import re"),
+        ("+", "", "3", "import sys"),
+        (" ", "3", "4", ""),
+        (" ", "4", "5", "def main():"),
+    ]
+    assert numbered_rows(hunk, 2) == numbered_rows(hunk)[:2]
+
+
+def test_disallowed_files_are_dropped_at_their_header():
+    items = flatten(iter_unified_diff(SAMPLE_DIFF, allowed_exts=(".py", ".js")))
+
+    assert [item[1] for item in items if item[0] == "file"] == ["src/app.py", "lib/util.js"]
+    # Filtering at the header yields the same as filtering the parsed files afterwards
+    unfiltered = flatten(iter_unified_diff(SAMPLE_DIFF))
+    kept, keep = [], False
+    for item in unfiltered:
+        if item[0] == "file":
+            keep = item[1].endswith((".py", ".js"))
+        if keep:
+            kept.append(item)
+    assert items == kept
+
+
+def test_iter_lines_jumps_over_disallowed_files():
+    lines = list(iter_lines(SAMPLE_DIFF, allowed_exts=(".md",)))
+
+    assert lines[0] == "diff --git a/docs/guide.md b/docs/guide.md"
+    assert lines[-1] == "\\ No newline at end of file"
+    assert not any(".py" in line or ".png" in line or ".js" in line for line in lines)
+    assert list(iter_unified_diff(SAMPLE_DIFF, allowed_exts=(".png",))) == [DiffFile("logo.png", "logo.png")]
+
+
+def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def test_max_bytes_stops_inside_a_single_long_line():
+    body = b"diff --git a/app.min.js b/app.min.js\n@@ -1 +1 @@\n+" + b"x" * (8 << 20) + b"\n"
+    reader = DiffReader(DiffLimits(max_bytes=1 << 20))
+    fed = 0
+    for chunk in chunked(body, 64 * 1024):
+        fed += len(chunk)
+        if not reader.feed(chunk):
+            break
+
+    assert fed <= (1 << 20) + 64 * 1024
+    # The line that crosses the budget is dropped
+    assert reader.text() == "diff --git a/app.min.js b/app.min.js\n@@ -1 +1 @@\n"
+
+
+def test_long_line_in_a_skipped_file_is_not_buffered():
+    body = b"diff --git a/app.min.js b/app.min.js\n@@ -1 +1 @@\n+" + b"x" * (1 << 20) + b"\n"
+    body += b"diff --git a/a.py b/a.py\n@@ -1 +1 @@\n+kept\n"
+    reader = DiffReader(DiffLimits(allowed_exts=(".py",)))
+    for chunk in chunked(body, 64 * 1024):
+        reader.feed(chunk)
+        assert len(reader._pending) < 64 * 1024
+
+    assert reader.text() == "diff --git a/a.py b/a.py\n@@ -1 +1 @@\n+kept\n"
+
+
+def test_read_diff_keeps_lines_that_fit_the_byte_budget():
+    body = b"diff --git a/a.py b/a.py\n@@ -1 +1 @@\n+one\n+two\n"
+    budget = len(b"diff --git a/a.py b/a.py\n@@ -1 +1 @@\n+one\n")
+
+    assert read_diff(chunked(body, 3), DiffLimits(max_bytes=budget)) == body[:budget].decode()
+    assert read_diff(chunked(body, 3), DiffLimits(max_bytes=budget - 1)) == "diff --git a/a.py b/a.py\n@@ -1 +1 @@\n"
+
+
+def test_max_lines_counts_hunk_rows_of_kept_files():
+    text = read_diff([SAMPLE_DIFF.encode()], DiffLimits(allowed_exts=(".py",), max_lines=3))
+
+    assert text == (
+        "diff --git a/src/app.py b/src/app.py\nindex 83db48f..bf269f4 100644\n--- a/src/app.py\n+++ b/src/app.py\n"
+        "@@ -1,4 +1,5 @@ import os\n import os\n-import sys\n+import re\n"
+    )
+
+
+def test_chunk_boundaries_do_not_change_the_result():
+    body = SAMPLE_DIFF.replace("Old line", "Ölde líne").encode()
+    limits = DiffLimits(allowed_exts=(".md", ".js"), max_lines=4)
+    expected = read_diff([body], limits)
+
+    assert "Ölde líne" in expected
+    assert "app.py" not in expected
+    # Sizes that split lines, file headers and multi-byte characters
+    for size in (1, 2, 3, 7, 11, 64):
+        assert read_diff(chunked(body, size), limits) == expected
+    assert read_diff(chunked(body, 5), DiffLimits()) == SAMPLE_DIFF.replace("Old line", "Ölde líne")
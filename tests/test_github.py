@@ -0,0 +1,177 @@
+import threading
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from gh_summary.commit import Commit
+from gh_summary.github import (
+    MAX_AUTHORS_PER_QUERY,
+    SEARCH_QUERY_MAX_LENGTH,
+    batch_authors,
+    get_date_range,
+    iter_search_windows,
+    route_by_login,
+    split_date_window,
+)
+
+
+class FakeSearchClient:
+    """Answers ``q=range:<range>`` searches over ``items_per_day``, 100 items per page."""
+
+    def __init__(self, items_per_day: dict[str, int]) -> None:
+        self.items = [
+            {"id": f"{day}#{i}", "day": day} for day, count in sorted(items_per_day.items()) for i in range(count)
+        ]
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    def get_conditional(self, url: str, *, headers=None) -> "FakeResponse":
+        with self._lock:
+            self.requests.append(url)
+        query = parse_qs(urlparse(url).query)
+        date_range = query["q"][0].removeprefix("range:")
+        start, end = "0000-00-00", "9999-99-99"
+        if date_range.startswith(">="):
+            start = date_range[2:]
+        elif date_range.startswith("<="):
+            end = date_range[2:]
+        elif ".." in date_range:
+            start, end = date_range.split("..")
+        matching = [item for item in self.items if start <= item["day"] <= end]
+        per_page, page = int(query["per_page"][0]), int(query.get("page", ["1"])[0])
+        # Like GitHub, no more than 1000 results are reachable
+        reachable = matching[:1000]
+        next_url = f"{url.split('&page=')[0]}&page={page + 1}" if page * per_page < len(reachable) else None
+        return FakeResponse(
+            {"total_count": len(matching), "items": reachable[(page - 1) * per_page : page * per_page]}, next_url
+        )
+
+
+class FakeResponse:
+    def __init__(self, data: dict, next_url: str | None) -> None:
+        self._data = data
+        self.links = {"next": {"url": next_url}} if next_url else {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self._data
+
+
+def url_for_range(date_range: str | None) -> str:
+    return f"https://api.github.com/search/commits?q=range:{date_range or ''}"
+
+
+def test_get_date_range():
+    assert get_date_range() is None
+    assert get_date_range(start_date="2024-01-01") == ">=2024-01-01"
+    assert get_date_range(end_date="2024-01-31") == "<=2024-01-31"
+    assert get_date_range(start_date="2024-01-01", end_date="2024-01-31") == "2024-01-01..2024-01-31"
+
+
+def test_split_date_window():
+    assert split_date_window("2024-01-01", "2024-01-04") == [("2024-01-01", "2024-01-02"), ("2024-01-03", "2024-01-04")]
+    assert split_date_window("2024-01-01", "2024-01-01") is None
+    (_, _), (_, end) = split_date_window("2024-01-01", None)
+    assert end == date.today().isoformat()
+
+
+def test_split_open_ended_range_keeps_history_before_2008():
+    (first_start, first_end), (second_start, _) = split_date_window(None, "2024-01-01")
+
+    assert first_start <= "2000-01-01"
+    assert first_end < second_start
+
+
+def test_iter_search_windows_follows_pages():
+    client = FakeSearchClient({"2024-01-10": 150, "2024-01-20": 100})
+
+    items = list(iter_search_windows(client, url_for_range, start_date="2024-01-01", end_date="2024-01-31"))
+
+    assert sorted(item["id"] for item in items) == sorted(item["id"] for item in client.items)
+    assert len(client.requests) == 3
+
+
+def test_iter_search_windows_splits_past_the_result_cap():
+    start = date(2024, 1, 1)
+    per_day = {(start + timedelta(days=i)).isoformat(): 90 for i in range(30)}
+    # Imported history from before GitHub existed
+    per_day["2001-05-05"] = 5
+    client = FakeSearchClient(per_day)
+
+    items = list(iter_search_windows(client, url_for_range, end_date="2024-01-30"))
+
+    assert len(items) == len(client.items) == 2705
+    assert len({item["id"] for item in items}) == len(items)
+
+
+def test_iter_search_windows_warns_about_a_single_day_past_the_cap():
+    client = FakeSearchClient({"2024-01-10": 1200})
+
+    with pytest.warns(UserWarning, match="only the first 1000"):
+        items = list(iter_search_windows(client, url_for_range, start_date="2024-01-10", end_date="2024-01-10"))
+    assert len(items) == 1000
+
+
+def test_batch_authors_respects_count_and_length():
+    authors = [f"user{i}" for i in range(14)]
+    batches = batch_authors(authors)
+
+    assert [a for batch in batches for a in batch] == authors
+    assert all(len(batch) <= MAX_AUTHORS_PER_QUERY for batch in batches)
+    assert len(batches) == 3
+
+    long_names = ["x" * 60 for _ in range(4)]
+    for batch in batch_authors(long_names):
+        assert 64 + sum(len(f"author:{a}") + 1 for a in batch) <= SEARCH_QUERY_MAX_LENGTH
+    # An author whose qualifier alone is too long still gets a batch of its own
+    assert batch_authors(["y" * 300, "z"]) == [["y" * 300], ["z"]]
+
+
+def test_route_by_login_matches_logins_case_insensitively():
+    items = [
+        {"author": {"login": "Alice"}},
+        {"author": {"login": "bob"}},
+        {"author": None},
+        {"author": {"login": "eve"}},
+    ]
+
+    def login_of(item: dict) -> str | None:
+        return (item.get("author") or {}).get("login")
+
+    routed = list(route_by_login(iter(items), ["alice", "Bob"], login_of))
+
+    assert routed == [("alice", items[0]), ("Bob", items[1])]
+    # With a single author, items without a (matching) login still belong to it
+    assert [a for a, _ in route_by_login(iter(items), ["alice"], lambda item: None)] == ["alice"] * 4
+
+
+def test_from_search_many_splits_results_by_author(monkeypatch):
+    def commit_item(sha: str, login: str | None) -> dict:
+        return {
+            "sha": sha,
+            "html_url": f"https://github.com/o/r/commit/{sha}",
+            "repository": {"html_url": "https://github.com/o/r", "full_name": "o/r"},
+            "author": {"login": login} if login else None,
+            "commit": {
+                "author": {"name": login or "?", "date": "2024-01-10T00:00:00Z"},
+                "committer": {"name": "c", "date": "2024-01-10T00:00:00Z"},
+                "message": "m",
+            },
+        }
+
+    searched = []
+
+    def fake_windows(client, url_for_range, **kwargs):
+        url = url_for_range(None)
+        searched.append(url)
+        if "author:a" in url:
+            yield from [commit_item("1", "A"), commit_item("2", "b"), commit_item("3", None), commit_item("1", "a")]
+
+    monkeypatch.setattr("gh_summary.commit.iter_search_windows", fake_windows)
+    found = Commit.from_search_many(["a", "b"], client=object())
+
+    assert len(searched) == 1 and "author:a+author:b" in searched[0]
+    assert {author: [c.sha for c in commits] for author, commits in found.items()} == {"a": ["1"], "b": ["2"]}
@@ -0,0 +1,75 @@
+import time
+
+import requests
+
+from gh_summary.ratelimit import RateLimiter, resource_for_url
+
+
+def make_response(status: int = 200, headers: dict[str, str] | None = None, body: str = "") -> requests.Response:
+    res = requests.Response()
+    res.status_code = status
+    res.headers.update(headers or {})
+    res._content = body.encode()
+    return res
+
+
+def test_resource_for_url():
+    assert resource_for_url("https://api.github.com/search/commits?q=author:a") == "search"
+    assert resource_for_url("https://api.github.com/graphql") == "graphql"
+    assert resource_for_url("https://api.github.com/repos/o/r/commits/abc") == "core"
+    assert resource_for_url("https://github.com/o/r/commit/abc.diff") is None
+
+
+def test_retry_after_header_wins():
+    limiter = RateLimiter()
+
+    assert limiter.retry_delay(make_response(429, {"Retry-After": "7"}), 0) == 7.0
+    assert limiter.retry_delay(make_response(403, {"Retry-After": "3"}), 0) == 3.0
+
+
+def test_exhausted_budget_waits_for_the_reset():
+    reset = time.time() + 30
+    res = make_response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+
+    assert 30 <= RateLimiter().retry_delay(res, 0) <= 31.5
+
+
+def test_plain_403_is_not_retried():
+    limiter = RateLimiter()
+
+    assert limiter.retry_delay(make_response(403, body='{"message": "Resource not accessible"}'), 0) is None
+    assert limiter.retry_delay(make_response(404), 0) is None
+    # Secondary rate limits back off, up to max_retries
+    secondary = make_response(403, body='{"message": "You have exceeded a secondary rate limit"}')
+    assert 0 <= limiter.retry_delay(secondary, 0) <= 2
+    assert limiter.retry_delay(secondary, limiter.max_retries) is None
+
+
+def test_reserve_paces_and_waits_on_the_budget():
+    limiter = RateLimiter(pace_below=10)
+    assert limiter.reserve(None) == 0.0
+    assert limiter.reserve("core") == 0.0
+
+    reset = time.time() + 100
+    limiter.update("core", make_response(headers={"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": str(reset)}))
+    assert limiter.reserve("core") == 0.0
+
+    # Nearly exhausted: requests are spread over the time left (100 s over the 4 left)
+    limiter.update("search", make_response(headers={"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(reset)}))
+    first = limiter.reserve("search")
+    second = limiter.reserve("search")
+    assert 24 <= second - first <= 25.5
+
+    # Exhausted: wait until the reset
+    limiter.update("core", make_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}))
+    assert 99 <= limiter.reserve("core") <= 101.5
+
+
+def test_update_keeps_the_lowest_budget_of_a_window():
+    limiter = RateLimiter()
+    reset = str(time.time() + 100)
+    limiter.update("core", make_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}))
+    # A response sent earlier in the same window arrives late
+    limiter.update("core", make_response(headers={"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": reset}))
+
+    assert limiter.reserve("core") > 90
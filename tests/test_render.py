@@ -0,0 +1,65 @@
+import io
+import sys
+
+import pytest
+
+from gh_summary import PDF, render
+from gh_summary.commit import Commit
+
+
+def test_render_chunked_checks_for_pypdf_before_rendering(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    rendered = []
+    monkeypatch.setattr(render, "render_chunk", lambda *args: rendered.append(args))
+
+    with pytest.raises(ImportError, match="pypdf"):
+        render.render_chunked(str(tmp_path / "out.pdf"), [], [], pdf_options={}, chunk_size=1)
+    assert rendered == []
+
+
+def make_commit(diff: str) -> Commit:
+    return Commit(
+        sha="abc123",
+        html_url="https://github.com/o/r/commit/abc123",
+        repo_url="https://github.com/o/r",
+        repo_name="o/r",
+        author="a",
+        committer="c",
+        date="2024-01-10T00:00:00Z",
+        message="Change things",
+        diff=diff,
+    )
+
+
+def long_diff(rows: int) -> str:
+    body = "".join(f"+added line {i} → café\n" if i % 3 else f" context line {i}\n" for i in range(rows))
+    header = "diff --git a/src/app.py b/src/app.py\n--- a/src/app.py\n+++ b/src/app.py\n"
+    return f"{header}@@ -1,{rows} +1,{rows} @@\n{body}"
+
+
+def test_text_block_writes_one_text_object():
+    pdf = PDF()
+    pdf.set_compression(False)
+    pdf.add_page()
+    pdf.set_font("Courier", size=8)
+    pdf._text_block([(10, 20, "first", (255, 0, 0)), (10, 25, "second", (255, 0, 0)), (10, 30, "third", (0, 0, 0))])
+
+    content = bytes(pdf.output())
+    assert content.count(b"q BT") == 1 and content.count(b"ET Q") == 1
+    assert b"(first)" in content and b"(second)" in content and b"(third)" in content
+    # The color is only set again when it changes
+    assert content.count(b"1.0000 0.0000 0.0000 rg") == 1
+
+
+def test_diff_rows_render_across_pages():
+    pypdf = pytest.importorskip("pypdf")
+    pdf = PDF(include_diffs=True, max_diff_lines=0, allowed_diff_exts=[".py"])
+    pdf.add_commits([make_commit(long_diff(300))])
+
+    reader = pypdf.PdfReader(io.BytesIO(bytes(pdf.output())))
+    text = "\n".join(page.extract_text() for page in reader.pages)
+    assert len(reader.pages) > 3
+    assert "src/app.py" in text
+    assert "added line 1 -> café" in text
+    assert "context line 297" in text
+    assert "300" in text
@@ -0,0 +1,133 @@
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+from gh_summary import __main__ as cli
+from gh_summary.commit import Commit
+from gh_summary.diff import DiffLimits
+from gh_summary.pr import PullRequest
+from gh_summary.store import ItemStore
+
+
+def make_commit(sha: str, repo_name: str = "o/r", *, date: str, author_date: str = "", diff: str = "") -> Commit:
+    return Commit(
+        sha=sha,
+        html_url=f"https://github.com/{repo_name}/commit/{sha}",
+        repo_url=f"https://github.com/{repo_name}",
+        repo_name=repo_name,
+        author="a",
+        committer="c",
+        date=date,
+        author_date=author_date,
+        message="m",
+        diff=diff,
+    )
+
+
+def make_pr(number: int, *, merged_at: str, diff: str = "") -> PullRequest:
+    return PullRequest(
+        repo_url="https://api.github.com/repos/o/r",
+        html_url=f"https://github.com/o/r/pull/{number}",
+        diff_url=f"https://github.com/o/r/pull/{number}.diff",
+        api_url=f"https://api.github.com/repos/o/r/pulls/{number}",
+        merged_at=merged_at,
+        title="t",
+        body="",
+        diff=diff,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ItemStore(str(tmp_path)) as store:
+        yield store
+
+
+def test_fetch_start_without_coverage(store):
+    assert store.fetch_start("a", "commits", start_date="2024-01-01", end_date="2024-01-31") == "2024-01-01"
+
+
+def test_fetch_start_after_mark_fetched(store):
+    store.mark_fetched("a", "commits", start_date="2024-01-01", end_date="2024-01-31")
+
+    assert store.fetch_start("a", "commits", start_date="2024-01-01", end_date="2024-01-15") is None
+    # The high-water mark is searched again, it may have been incomplete
+    assert store.fetch_start("a", "commits", start_date="2024-01-10", end_date="2024-02-29") == "2024-01-31"
+    assert store.fetch_start("a", "commits", start_date="2023-12-01", end_date="2024-01-15") == "2023-12-01"
+    assert store.fetch_start("A", "commits", start_date="2024-01-01", end_date="2024-01-15") is None
+    assert store.fetch_start("a", "prs", start_date="2024-01-01", end_date="2024-01-15") == "2024-01-01"
+
+
+def test_mark_fetched_extends_adjacent_coverage_and_stops_before_today(store):
+    store.mark_fetched("a", "commits", start_date="2024-01-01", end_date="2024-01-31")
+    store.mark_fetched("a", "commits", start_date="2024-01-31", end_date=None)
+
+    today = date.today()
+    assert store.fetch_start("a", "commits", start_date="2024-01-01", end_date="2024-06-30") is None
+    assert store.fetch_start("a", "commits", start_date="2024-01-01", end_date=None) == today.isoformat()
+    yesterday = (today - timedelta(days=1)).isoformat()
+    assert store.fetch_start("a", "commits", start_date="2024-01-01", end_date=yesterday) is None
+
+
+def test_commits_are_filed_under_their_author_date(store):
+    # Authored in January, committed (e.g. rebased) in March
+    commit = make_commit("s1", date="2024-03-05T00:00:00Z", author_date="2024-01-10T00:00:00Z")
+    store.record_commits("a", [commit], start_date="2024-01-01", end_date="2024-01-31", complete=True)
+
+    assert [c.sha for c in store.commits("a", start_date="2024-01-01", end_date="2024-01-31")] == ["s1"]
+    assert store.commits("a", start_date="2024-03-01", end_date="2024-03-31") == []
+
+
+def test_diffs_are_only_returned_for_the_same_limits(store):
+    limits = DiffLimits(max_lines=10)
+    commit = make_commit("s1", date="2024-01-10T00:00:00Z", diff="trimmed")
+    pr = make_pr(1, merged_at="2024-01-10T00:00:00Z", diff="trimmed")
+    store.record_commits("a", [commit], start_date="2024-01-01", end_date="2024-01-31", complete=True)
+    store.record_prs("a", [pr], start_date="2024-01-01", end_date="2024-01-31", complete=True)
+    # Items are saved without their diff; diffs only come with the limits they were trimmed with
+    assert store.commits("a", diff_key=limits.key)[0].diff == ""
+
+    store.put_diffs("a", [commit], limits.key)
+    store.put_diffs("a", [pr], limits.key)
+    assert store.commits("a", diff_key=limits.key)[0].diff == "trimmed"
+    assert store.prs("a", diff_key=limits.key)[0].diff == "trimmed"
+    assert store.commits("a", diff_key=DiffLimits().key)[0].diff == ""
+    assert store.prs("a", diff_key=DiffLimits(max_lines=20).key)[0].diff == ""
+    assert store.commits("a")[0].diff == ""
+
+    # Saving the item again, e.g. from a later search, keeps its diff
+    again = make_commit("s1", date="2024-01-10T00:00:00Z")
+    store.record_commits("a", [again], start_date=None, end_date=None, complete=False)
+    assert store.commits("a", diff_key=limits.key)[0].diff == "trimmed"
+
+
+def test_incremental_runs_with_different_repo_filters(tmp_path, monkeypatch):
+    found = [
+        make_commit("s1", "o/r", date="2024-01-10T00:00:00Z", author_date="2024-01-10T00:00:00Z"),
+        make_commit("s2", "o/other", date="2024-01-11T00:00:00Z", author_date="2024-01-11T00:00:00Z"),
+    ]
+
+    def from_search(author, *, start_date, include_repos=None, exclude_repos=None, max_results=None, **kwargs):
+        return Commit.collect(
+            (c for c in found if c.author_date[:10] >= start_date),
+            include_repos=include_repos,
+            exclude_repos=exclude_repos,
+            max_results=max_results,
+        )
+
+    monkeypatch.setattr(Commit, "from_search", from_search)
+    monkeypatch.setattr(PullRequest, "from_search", lambda *args, **kwargs: [])
+
+    def run(*extra: str) -> list[str]:
+        monkeypatch.setattr(sys, "argv", ["gh-summary", "-a", "a", "-s", "2024-01-01", "-e", "2024-01-31", *extra])
+        args = cli.parse_args()
+        with ItemStore(str(tmp_path)) as store:
+            commits, _ = cli.collect_author(args, "a", client=None, headers={}, store=store)
+        return [c.repo_name for c in commits]
+
+    assert run("--include-repo", "o/other") == ["o/other"]
+    # The first run covered January for every repository, not just the filtered one
+    assert run() == ["o/r", "o/other"]
+    assert run("--exclude-repo", "o/other") == ["o/r"]
+    assert run("--max-results", "1") == ["o/r"]